@@ -0,0 +1,102 @@
+import { describe, expect, it } from "vitest";
+import { FasterWhisperWorker } from "./faster-whisper-worker.js";
+import { FasterWhisperBackend } from "./faster-whisper.js";
+import type { PythonCommand } from "../deps/faster-whisper.js";
+
+/**
+ * Stand-in for the Python worker speaking the same JSON-lines protocol.
+ * The worker appends "-u -c <script>" to the command, which lands after "--".
+ */
+const STUB_SCRIPT = `
+const lines = require("node:readline").createInterface({ input: process.stdin });
+lines.on("line", (line) => {
+  const request = JSON.parse(line);
+  if (request.model === "crash") {
+    process.stderr.write("CUDA out of memory\\n");
+    process.exit(3);
+  }
+  const response = request.model === "bad"
+    ? { id: request.id, ok: false, error: "ValueError: unknown model" }
+    : { id: request.id, ok: true };
+  setTimeout(() => process.stdout.write(JSON.stringify(response) + "\\n"), request.delay ?? 0);
+});
+`;
+
+const STUB: PythonCommand = {
+  command: process.execPath,
+  args: ["-e", STUB_SCRIPT, "--"],
+  display: "node stub",
+};
+
+function startStub(): FasterWhisperWorker {
+  return new FasterWhisperWorker(STUB.command, STUB.args);
+}
+
+describe("FasterWhisperWorker", () => {
+  it("matches responses to requests by id", async () => {
+    const worker = startStub();
+    try {
+      const slow = worker.request({ model: "tiny", delay: 50 });
+      const fast = worker.request({ model: "tiny" });
+      const [slowResponse, fastResponse] = await Promise.all([slow, fast]);
+      expect(slowResponse.id).toBe(1);
+      expect(fastResponse.id).toBe(2);
+    } finally {
+      await worker.close();
+    }
+  });
+
+  it("rejects failed requests with the worker's error", async () => {
+    const worker = startStub();
+    try {
+      await expect(worker.request({ model: "bad" })).rejects.toThrow(
+        "faster-whisper request failed: ValueError: unknown model",
+      );
+      expect(worker.alive).toBe(true);
+    } finally {
+      await worker.close();
+    }
+  });
+
+  it("fails pending requests with the stderr tail when the worker exits", async () => {
+    const worker = startStub();
+    const pending = worker.request({ model: "tiny", delay: 1000 });
+    await expect(worker.request({ model: "crash" })).rejects.toThrow("exited with code 3\nCUDA out of memory");
+    await expect(pending).rejects.toThrow("exited with code 3");
+    expect(worker.alive).toBe(false);
+    await expect(worker.request({ model: "tiny" })).rejects.toThrow("not running");
+  });
+
+  it("fails requests when the worker cannot be started", async () => {
+    const worker = new FasterWhisperWorker("media-transcriber-missing-python", []);
+    await expect(worker.request({ model: "tiny" })).rejects.toThrow("failed to start");
+    expect(worker.alive).toBe(false);
+  });
+});
+
+describe("FasterWhisperBackend", () => {
+  it("starts a new worker after the previous one died", async () => {
+    const backend = new FasterWhisperBackend();
+    (backend as unknown as { python: PythonCommand }).python = STUB;
+    try {
+      await backend.prepare("tiny", "cpu");
+      await expect(backend.prepare("crash", "cpu")).rejects.toThrow("exited with code 3");
+      await expect(backend.prepare("tiny", "cpu")).resolves.toBeUndefined();
+    } finally {
+      await backend.dispose();
+    }
+  });
+
+  it("shares one worker start between concurrent requests", async () => {
+    const backend = new FasterWhisperBackend();
+    (backend as unknown as { python: PythonCommand }).python = STUB;
+    const getWorker = () =>
+      (backend as unknown as { getWorker(): Promise<FasterWhisperWorker> }).getWorker();
+    try {
+      const [first, second] = await Promise.all([getWorker(), getWorker()]);
+      expect(first).toBe(second);
+    } finally {
+      await backend.dispose();
+    }
+  });
+});
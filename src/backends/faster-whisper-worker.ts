@@ -0,0 +1,278 @@
+import { spawn, type ChildProcessWithoutNullStreams } from "node:child_process";
+import { once } from "node:events";
+import { createInterface } from "node:readline";
+
+/** Characters of worker stderr kept for error messages */
+const STDERR_TAIL_CHARS = 4096;
+
+/**
+ * Python side of the faster-whisper backend.
+ * Reads one JSON request per line from stdin, writes one JSON response per
+ * line to stdout. The model stays loaded between requests and is only
+ * reloaded when the model name, device, or compute type changes.
+ * Requests carrying "items" transcribe several inputs through one batched
+ * pipeline that is kept alongside the model; "prepare" requests only load
+ * (and on CUDA, warm up) the model.
+ */
+export const WORKER_SCRIPT = String.raw`
+import json
+import subprocess
+import sys
+
+BATCH_SIZE = 8
+
+_model = None
+_model_key = None
+_batched = None
+
+
+def resolve_device(device):
+    if device != "auto":
+        return device
+    try:
+        import ctranslate2
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except Exception:
+        return "cpu"
+
+
+def get_model(name, device, compute_type):
+    global _model, _model_key, _batched
+    device = resolve_device(device)
+    if not compute_type or compute_type == "auto":
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+    key = (name, device, compute_type)
+    if _model_key != key:
+        from faster_whisper import WhisperModel
+        # Release the old model before loading, and forget its key so a
+        # failed load is retried instead of serving a missing model
+        _model = None
+        _model_key = None
+        _batched = None
+        _model = WhisperModel(name, device=device, compute_type=compute_type)
+        _model_key = key
+        if device == "cuda":
+            warm_up(_model)
+    return _model
+
+
+def warm_up(model):
+    """Run one second of silence so CUDA setup is not paid by the first file."""
+    try:
+        import numpy as np
+        segments, _info = model.transcribe(np.zeros(16000, dtype=np.float32), language="en")
+        for _segment in segments:
+            pass
+    except Exception:
+        pass
+
+
+def get_batched(model):
+    global _batched
+    if _batched is None:
+        try:
+            from faster_whisper import BatchedInferencePipeline
+            _batched = BatchedInferencePipeline(model=model)
+        except ImportError:
+            # faster-whisper < 1.1 has no batched pipeline
+            _batched = False
+    return _batched
+
+
+def load_audio(path, sample_rate=16000):
+    """Decode any ffmpeg-readable input to mono float32 PCM through a pipe."""
+    import numpy as np
+    process = subprocess.Popen(
+        [
+            "ffmpeg", "-hide_banner", "-nostdin", "-v", "error",
+            "-i", path, "-vn", "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "-",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=1 << 20,
+    )
+    pcm, err = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError("ffmpeg failed to decode %s: %s" % (path, err.decode("utf-8", "replace")[-2000:].strip()))
+    return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def srt_timestamp(seconds):
+    ms = max(0, int(round(seconds * 1000)))
+    hours, ms = divmod(ms, 3600000)
+    minutes, ms = divmod(ms, 60000)
+    secs, ms = divmod(ms, 1000)
+    return "%02d:%02d:%02d,%03d" % (hours, minutes, secs, ms)
+
+
+def write_outputs(segments, request):
+    txt = open(request["txt"], "w", encoding="utf-8") if request.get("txt") else None
+    srt = open(request["srt"], "w", encoding="utf-8") if request.get("srt") else None
+    try:
+        for index, segment in enumerate(segments, start=1):
+            text = segment.text.strip()
+            if txt:
+                txt.write(text + "\n")
+            if srt:
+                srt.write("%d\n%s --> %s\n%s\n\n" % (
+                    index,
+                    srt_timestamp(segment.start),
+                    srt_timestamp(segment.end),
+                    text,
+                ))
+    finally:
+        for handle in (txt, srt):
+            if handle:
+                handle.close()
+
+
+def transcribe(request):
+    model = get_model(request["model"], request["device"], request.get("compute_type"))
+    audio = load_audio(request["input"])
+    segments, _info = model.transcribe(audio, beam_size=5, vad_filter=True)
+    write_outputs(segments, request)
+
+
+def transcribe_batch(request):
+    model = get_model(request["model"], request["device"], request.get("compute_type"))
+    batched = get_batched(model)
+    for item in request["items"]:
+        audio = load_audio(item["input"])
+        if batched:
+            # Keep segment-level timestamps so cues match the unbatched path
+            segments, _info = batched.transcribe(
+                audio, beam_size=5, batch_size=BATCH_SIZE, without_timestamps=False
+            )
+        else:
+            segments, _info = model.transcribe(audio, beam_size=5, vad_filter=True)
+        write_outputs(segments, item)
+
+
+def main():
+    protocol = sys.stdout
+    # Keep library prints off the protocol stream
+    sys.stdout = sys.stderr
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        response = {"id": request.get("id")}
+        try:
+            if request.get("op") == "prepare":
+                get_model(request["model"], request["device"], request.get("compute_type"))
+            elif "items" in request:
+                transcribe_batch(request)
+            else:
+                transcribe(request)
+            response["ok"] = True
+        except Exception as exc:
+            response["ok"] = False
+            response["error"] = "%s: %s" % (type(exc).__name__, exc)
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+
+
+main()
+`;
+
+export interface WorkerResponse {
+  id: number;
+  ok: boolean;
+  error?: string;
+}
+
+interface PendingRequest {
+  resolve: (response: WorkerResponse) => void;
+  reject: (err: Error) => void;
+}
+
+/**
+ * Long-lived Python process running WORKER_SCRIPT.
+ * Requests are answered in order; each returns a promise for its response.
+ */
+export class FasterWhisperWorker {
+  private readonly child: ChildProcessWithoutNullStreams;
+  private readonly pending = new Map<number, PendingRequest>();
+  private nextId = 1;
+  private stderrTail = "";
+  private running = true;
+
+  constructor(command: string, args: string[]) {
+    this.child = spawn(command, [...args, "-u", "-c", WORKER_SCRIPT], {
+      env: { ...process.env, PYTHONIOENCODING: "utf-8" },
+      windowsHide: true,
+    });
+
+    createInterface({ input: this.child.stdout }).on("line", (line) => this.handleLine(line));
+
+    this.child.stderr.setEncoding("utf-8");
+    this.child.stderr.on("data", (chunk: string) => {
+      this.stderrTail = (this.stderrTail + chunk).slice(-STDERR_TAIL_CHARS);
+    });
+
+    // Write failures after the worker dies are reported through "close"
+    this.child.stdin.on("error", () => {});
+
+    this.child.on("error", (err) => {
+      this.running = false;
+      this.failPending(`failed to start: ${err.message}`);
+    });
+    // "close" waits for stderr to drain, so the tail is complete
+    this.child.on("close", (code) => {
+      this.running = false;
+      this.failPending(`worker exited with code ${code}`);
+    });
+  }
+
+  /** Whether the worker process is still accepting requests */
+  get alive(): boolean {
+    return this.running;
+  }
+
+  request(payload: Record<string, unknown>): Promise<WorkerResponse> {
+    if (!this.running) {
+      return Promise.reject(new Error("faster-whisper worker is not running"));
+    }
+
+    const id = this.nextId++;
+    return new Promise<WorkerResponse>((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      this.child.stdin.write(JSON.stringify({ ...payload, id }) + "\n");
+    });
+  }
+
+  /** Close stdin and wait for the worker to exit */
+  async close(): Promise<void> {
+    if (!this.running) return;
+    const exited = once(this.child, "close");
+    this.child.stdin.end();
+    await exited;
+  }
+
+  private handleLine(line: string): void {
+    let response: WorkerResponse;
+    try {
+      response = JSON.parse(line) as WorkerResponse;
+    } catch {
+      return;
+    }
+
+    const request = this.pending.get(response.id);
+    if (!request) return;
+    this.pending.delete(response.id);
+
+    if (response.ok) {
+      request.resolve(response);
+    } else {
+      request.reject(new Error(`faster-whisper request failed: ${response.error ?? "unknown error"}`));
+    }
+  }
+
+  private failPending(reason: string): void {
+    const tail = this.stderrTail.trim();
+    for (const request of this.pending.values()) {
+      request.reject(new Error(`faster-whisper ${reason}${tail ? `\n${tail}` : ""}`));
+    }
+    this.pending.clear();
+  }
+}
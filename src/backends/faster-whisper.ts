@@ -0,0 +1,159 @@
+import { existsSync } from "node:fs";
+import { mkdir } from "node:fs/promises";
+import { join, basename, extname } from "node:path";
+import type { TranscriptionBackend, TranscribeOptions } from "./types.js";
+import type { Config } from "../config/schema.js";
+import type { DependencyStatus, DevicePolicy, TranscriptSegment } from "../types/index.js";
+import {
+  discoverFasterWhisper,
+  type PythonCommand,
+} from "../deps/faster-whisper.js";
+import { FasterWhisperWorker } from "./faster-whisper-worker.js";
+
+/**
+ * In-process faster-whisper (CTranslate2) backend.
+ * Runs one Python worker per batch so the model is loaded once and reused
+ * for every file, instead of once per whisper CLI invocation.
+ */
+export class FasterWhisperBackend implements TranscriptionBackend {
+  readonly name = "faster-whisper";
+  readonly displayName = "faster-whisper (local)";
+  readonly defaultModel = "large-v2";
+
+  private python: PythonCommand | null = null;
+  /** Worker start shared by concurrent callers; the worker once it is running */
+  private workerStart: Promise<FasterWhisperWorker> | null = null;
+  private worker: FasterWhisperWorker | null = null;
+  private computeType: Config["computeType"] = "auto";
+
+  init(config: Config): void {
+    this.python = null;
+    this.computeType = config.computeType;
+  }
+
+  async checkAvailability(): Promise<DependencyStatus> {
+    const { python, ...status } = await discoverFasterWhisper();
+    this.python = python ?? null;
+    return status;
+  }
+
+  async transcribe(options: TranscribeOptions): Promise<TranscriptSegment> {
+    const segment = await prepareOutputs(options);
+
+    const worker = await this.getWorker();
+    await worker.request({
+      input: options.inputFile,
+      model: options.model,
+      device: options.device,
+      compute_type: this.computeType,
+      txt: segment.txtFile,
+      srt: segment.srtFile,
+    });
+
+    return segment;
+  }
+
+  /**
+   * Transcribe all inputs in one worker request through faster-whisper's
+   * batched pipeline. Every input must use the same model and device.
+   */
+  async transcribeBatch(options: TranscribeOptions[]): Promise<TranscriptSegment[]> {
+    if (options.length === 0) return [];
+
+    const { model, device } = options[0]!;
+    if (options.some((o) => o.model !== model || o.device !== device)) {
+      throw new Error("faster-whisper batch inputs must share one model and device");
+    }
+
+    const segments = await Promise.all(options.map(prepareOutputs));
+
+    const worker = await this.getWorker();
+    await worker.request({
+      model,
+      device,
+      compute_type: this.computeType,
+      items: segments.map((segment, i) => ({
+        input: options[i]!.inputFile,
+        txt: segment.txtFile,
+        srt: segment.srtFile,
+      })),
+    });
+
+    return segments;
+  }
+
+  /** Start the worker and load the model so the first file does not wait for it */
+  async prepare(model: string, device: DevicePolicy): Promise<void> {
+    const worker = await this.getWorker();
+    await worker.request({ op: "prepare", model, device, compute_type: this.computeType });
+  }
+
+  async dispose(): Promise<void> {
+    const start = this.workerStart;
+    this.workerStart = null;
+    this.worker = null;
+    const worker = await start?.catch(() => null);
+    await worker?.close();
+  }
+
+  supportedModels(): string[] {
+    return [
+      "tiny", "base", "small", "medium",
+      "large", "large-v1", "large-v2", "large-v3",
+      "turbo", "distil-large-v3",
+    ];
+  }
+
+  capabilities() {
+    return { decodesAnyInput: true };
+  }
+
+  /**
+   * Return the running worker, starting one if needed. The start is cached as
+   * a promise so concurrent callers (warm-up and the first file) share it.
+   */
+  private getWorker(): Promise<FasterWhisperWorker> {
+    if (this.worker && !this.worker.alive) {
+      this.worker = null;
+      this.workerStart = null;
+    }
+
+    this.workerStart ??= this.startWorker().then(
+      (worker) => (this.worker = worker),
+      (err: unknown) => {
+        // Let the next request try again
+        this.workerStart = null;
+        throw err;
+      },
+    );
+    return this.workerStart;
+  }
+
+  private async startWorker(): Promise<FasterWhisperWorker> {
+    const python = this.python ?? (await discoverFasterWhisper()).python;
+    if (!python) {
+      throw new Error("faster-whisper is not available. Run 'media-transcriber setup faster-whisper'.");
+    }
+
+    this.python = python;
+    return new FasterWhisperWorker(python.command, python.args);
+  }
+}
+
+/** Check the input and create its output folder; returns the output paths */
+async function prepareOutputs(options: TranscribeOptions): Promise<TranscriptSegment> {
+  const { inputFile, outputDir, outputFormats, outputName } = options;
+
+  if (!existsSync(inputFile)) {
+    throw new Error(`Input file not found: ${inputFile}`);
+  }
+
+  await mkdir(outputDir, { recursive: true });
+
+  const stem = outputName ?? basename(inputFile, extname(inputFile));
+  return {
+    txtFile: outputFormats.includes("txt") ? join(outputDir, `${stem}.txt`) : null,
+    srtFile: outputFormats.includes("srt") ? join(outputDir, `${stem}.srt`) : null,
+    partNumber: 0,
+  };
+}
@@ -1,6 +1,7 @@
 import type { TranscriptionBackend } from "./types.js";
 import { WhisperLocalBackend } from "./whisper-local.js";
 import { WhisperApiBackend } from "./whisper-api.js";
+import { FasterWhisperBackend } from "./faster-whisper.js";
 
 const backends = new Map<string, TranscriptionBackend>();
 
@@ -23,4 +24,5 @@ export function listBackends(): string[] {
 export function registerBuiltinBackends(): void {
   registerBackend(new WhisperLocalBackend());
   registerBackend(new WhisperApiBackend());
+  registerBackend(new FasterWhisperBackend());
 }
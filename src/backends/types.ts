@@ -8,6 +8,8 @@ import type { Config } from "../config/schema.js";
 
 export interface BackendCapabilities {
   maxInputBytes?: number;
+  /** Backend decodes any ffmpeg-readable container, so audio extraction is optional */
+  decodesAnyInput?: boolean;
 }
 
 /** Options for a single transcription call */
@@ -17,6 +19,8 @@ export interface TranscribeOptions {
   device: DevicePolicy;
   outputDir: string;
   outputFormats: OutputFormat[];
+  /** File name stem for the outputs; defaults to the input file's stem */
+  outputName?: string;
 }
 
 /** Interface that every transcription backend must implement */
@@ -36,6 +40,12 @@ export interface TranscriptionBackend {
   /** Run transcription on an audio file */
   transcribe(options: TranscribeOptions): Promise<TranscriptSegment>;
 
+  /**
+   * Transcribe several files in one call, returning results in input order.
+   * Optional: backends that can share model state across inputs implement it.
+   */
+  transcribeBatch?(options: TranscribeOptions[]): Promise<TranscriptSegment[]>;
+
   /** List of model names this backend supports */
   supportedModels(): string[];
 
@@ -44,6 +54,12 @@ export interface TranscriptionBackend {
 
   /** Initialize backend with config (e.g. API keys) */
   init(config: Config): void;
+
+  /** Load and warm up the model ahead of the first transcription */
+  prepare?(model: string, device: DevicePolicy): Promise<void>;
+
+  /** Release long-lived resources such as worker processes */
+  dispose?(): Promise<void>;
 }
 
 export function validateBackendModel(
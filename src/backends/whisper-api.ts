@@ -38,7 +38,7 @@ export class WhisperApiBackend implements TranscriptionBackend {
   }
 
   async transcribe(options: TranscribeOptions): Promise<TranscriptSegment> {
-    const { inputFile, outputDir, model, outputFormats } = options;
+    const { inputFile, outputDir, model, outputFormats, outputName } = options;
     const key = this.apiKey || process.env["OPENAI_API_KEY"];
 
     if (!key) {
@@ -61,7 +61,7 @@ export class WhisperApiBackend implements TranscriptionBackend {
 
     await mkdir(outputDir, { recursive: true });
 
-    const stem = basename(inputFile, extname(inputFile));
+    const stem = outputName ?? basename(inputFile, extname(inputFile));
     const wantSrt = outputFormats.includes("srt");
     const wantTxt = outputFormats.includes("txt");
     let srtPath: string | null = null;
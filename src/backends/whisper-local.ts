@@ -1,6 +1,6 @@
 import { execa } from "execa";
 import { existsSync } from "node:fs";
-import { readdir, readFile, writeFile, mkdir } from "node:fs/promises";
+import { readFile, rename, writeFile, mkdir } from "node:fs/promises";
 import { join, basename, extname } from "node:path";
 import type { TranscriptionBackend, TranscribeOptions } from "./types.js";
 import type { Config } from "../config/schema.js";
@@ -11,6 +11,9 @@ import {
   type CommandSpec,
 } from "../deps/whisper.js";
 
+const SRT_INDEX_RE = /^\d+$/;
+const LINE_BREAK_RE = /\r?\n/;
+
 /**
  * Local OpenAI Whisper CLI backend.
  * Invokes a discovered local Whisper command.
@@ -54,7 +57,7 @@ export class WhisperLocalBackend implements TranscriptionBackend {
   }
 
   async transcribe(options: TranscribeOptions): Promise<TranscriptSegment> {
-    const { inputFile, model, device, outputDir, outputFormats } = options;
+    const { inputFile, model, device, outputDir, outputFormats, outputName } = options;
 
     if (!existsSync(inputFile)) {
       throw new Error(`Input file not found: ${inputFile}`);
@@ -75,6 +78,11 @@ export class WhisperLocalBackend implements TranscriptionBackend {
       env["CUDA_VISIBLE_DEVICES"] = "0";
     }
 
+    // Whisper names its outputs after the input file; they are renamed to
+    // outputName afterwards. Callers give each run its own outputDir.
+    const stem = basename(inputFile, extname(inputFile));
+    const outputStem = outputName ?? stem;
+
     let result;
     try {
       result = await execa(
@@ -105,29 +113,24 @@ export class WhisperLocalBackend implements TranscriptionBackend {
       throw new Error(`Whisper transcription failed: ${stderr}`);
     }
 
-    // Find output files
-    const files = await readdir(outputDir);
-    const txtFile = files.find((f) => f.endsWith(".txt"));
-    const srtFile = files.find((f) => f.endsWith(".srt"));
-
-    const txtPath = txtFile ? join(outputDir, txtFile) : null;
-    const srtPath = srtFile ? join(outputDir, srtFile) : null;
+    const txtPath = await moveOutput(join(outputDir, `${stem}.txt`), join(outputDir, `${outputStem}.txt`));
+    const srtPath = await moveOutput(join(outputDir, `${stem}.srt`), join(outputDir, `${outputStem}.srt`));
     const wantTxt = outputFormats.includes("txt");
 
     // Fallback: if TXT is missing/empty but SRT exists, extract text from SRT
-    if (wantTxt && srtPath && (!txtPath || (existsSync(txtPath) && (await readFile(txtPath, "utf-8")).trim() === ""))) {
+    if (wantTxt && srtPath && (!txtPath || (await readFile(txtPath, "utf-8")).trim() === "")) {
       const srtContent = await readFile(srtPath, "utf-8");
       const textLines: string[] = [];
 
-      for (const line of srtContent.split(/\r?\n/)) {
+      for (const line of srtContent.split(LINE_BREAK_RE)) {
         const trimmed = line.trim();
         if (!trimmed) continue;
-        if (/^\d+$/.test(trimmed)) continue;
+        if (SRT_INDEX_RE.test(trimmed)) continue;
         if (trimmed.includes("-->")) continue;
         textLines.push(trimmed);
       }
 
-      const fallbackTxt = join(outputDir, `${basename(inputFile, extname(inputFile))}.txt`);
+      const fallbackTxt = join(outputDir, `${outputStem}.txt`);
       await writeFile(fallbackTxt, textLines.join("\n\n"), "utf-8");
 
       return {
@@ -149,6 +152,14 @@ export class WhisperLocalBackend implements TranscriptionBackend {
   }
 
   capabilities() {
-    return {};
+    // The whisper CLI decodes its input through ffmpeg
+    return { decodesAnyInput: true };
   }
 }
+
+/** Rename a Whisper output file; returns null when it was not produced */
+async function moveOutput(from: string, to: string): Promise<string | null> {
+  if (!existsSync(from)) return null;
+  await rename(from, to);
+  return to;
+}
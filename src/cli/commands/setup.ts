@@ -18,6 +18,7 @@ import {
   discoverLocalWhisper,
   findPythonCommand,
 } from "../../deps/whisper.js";
+import { discoverFasterWhisper } from "../../deps/faster-whisper.js";
 import { ExitCode } from "../../types/index.js";
 
 interface InstallOption {
@@ -49,6 +50,8 @@ export const setupCommand = new Command("setup")
       await setupLocalWhisper();
     } else if (backend.name === "whisper-api") {
       await setupApiBackend(backend);
+    } else if (backend.name === "faster-whisper") {
+      await setupFasterWhisper();
     } else {
       console.log(pc.yellow(`No guided setup flow is defined for '${backend.name}'.`));
     }
@@ -100,6 +103,36 @@ async function setupLocalWhisper(): Promise<void> {
   }
 }
 
+async function setupFasterWhisper(): Promise<void> {
+  const status = await discoverFasterWhisper();
+  if (status.available) {
+    console.log(`${pc.green("✓")} faster-whisper is available${status.command ? pc.gray(` (${status.command})`) : ""}`);
+    return;
+  }
+
+  console.log(pc.yellow("faster-whisper is not installed for the active Python."));
+  const python = await findPythonCommand();
+  const options: InstallOption[] = python
+    ? [{
+        id: "pip",
+        label: "Install faster-whisper in active Python",
+        command: python.command,
+        args: [...python.args, "-m", "pip", "install", "-U", "faster-whisper"],
+        display: `${python.display} -m pip install -U faster-whisper`,
+        availabilityCommand: python.command,
+        availabilityArgs: [...python.args, "--version"],
+      }]
+    : [];
+  const selected = await chooseInstallOption(
+    "Choose a faster-whisper install path",
+    options,
+    ["python -m pip install -U faster-whisper"],
+  );
+  if (selected) {
+    await runInstall(selected);
+  }
+}
+
 async function setupApiBackend(backend: TranscriptionBackend): Promise<void> {
   const config = configSchema.parse({
     backend: backend.name,
@@ -193,6 +226,7 @@ async function maybeRunSmokeTest(backend: TranscriptionBackend): Promise<void> {
     const message = err instanceof Error ? err.message : String(err);
     console.log(pc.red(`Smoke test failed: ${message}`));
   } finally {
+    await backend.dispose?.();
     await rm(workDir, { recursive: true, force: true });
   }
 }
@@ -15,7 +15,12 @@ import {
 import { WHISPER_COMMAND_ENV } from "../../deps/whisper.js";
 import { findInputFiles, runPipeline, runSingleFile } from "../../pipeline/orchestrator.js";
 import { formatJson, formatHuman } from "../../output/formatter.js";
-import { createHumanProgress, createJsonProgress, createSingleFileProgress } from "../../output/progress.js";
+import {
+  createBufferedProgress,
+  createHumanProgress,
+  createJsonProgress,
+  createSingleFileProgress,
+} from "../../output/progress.js";
 import { ExitCode, SUPPORTED_EXTENSIONS } from "../../types/index.js";
 import pc from "picocolors";
 import { join, dirname, extname } from "node:path";
@@ -27,10 +32,12 @@ interface TranscribeOptions {
   model?: string;
   preset?: QualityPreset;
   device?: string;
+  computeType?: string;
   backend?: string;
   splitThreshold?: number;
   enhanceAudio?: boolean;
   keepTemp?: boolean;
+  parallel?: number;
   apiKey?: string;
   format?: string[];
   whisperCommand?: string;
@@ -45,6 +52,14 @@ function parseSeconds(value: string): number {
   return parsed;
 }
 
+function parseCount(value: string): number {
+  const parsed = Number.parseInt(value, 10);
+  if (!Number.isFinite(parsed) || parsed <= 0) {
+    throw new InvalidArgumentError("Must be a positive integer.");
+  }
+  return parsed;
+}
+
 function parseFormats(value: string): string[] {
   const valid = ["txt", "srt"];
   const formats = [...new Set(value.split(",").map(f => f.trim().toLowerCase()).filter(Boolean))];
@@ -74,10 +89,12 @@ export const transcribeCommand = new Command("transcribe")
   .option("-m, --model <name>", "Backend model name")
   .option("--preset <name>", "Quality preset: fast, balanced, accurate", parsePreset)
   .option("-d, --device <type>", "Processing device: auto, cuda, or cpu")
+  .option("--compute-type <type>", "faster-whisper weight precision: auto, int8, int8_float16, int8_float32, float16, or float32")
   .option("-b, --backend <name>", "Transcription backend", "whisper-local")
   .option("--split-threshold <seconds>", "Split files longer than this duration", parseSeconds)
   .option("--enhance-audio", "Apply noise reduction and audio enhancement")
   .option("--keep-temp", "Keep intermediate files in output/temp folder")
+  .option("--parallel <count>", "Number of files to preprocess concurrently (folder input)", parseCount)
   .option("--api-key <key>", "API key for the backend (env: OPENAI_API_KEY)", process.env["OPENAI_API_KEY"])
   .option("--whisper-command <command>", `Local Whisper command override (env: ${WHISPER_COMMAND_ENV})`)
   .option("-f, --format <formats>", "Output formats, comma-separated: txt, srt", parseFormats)
@@ -187,9 +204,11 @@ Examples:
         backend: backend.name,
         whisperModel: selectedModel,
         device: opts.device,
+        computeType: opts.computeType,
         maxDurationSeconds: opts.splitThreshold,
         enableAudioEnhancement: opts.enhanceAudio === true,
         keepIntermediateFiles: opts.keepTemp === true,
+        parallelFiles: opts.parallel,
         openaiApiKey: opts.apiKey,
         outputFormats,
         localWhisperCommand: opts.whisperCommand ?? process.env[WHISPER_COMMAND_ENV],
@@ -313,11 +332,18 @@ Examples:
         console.error(pc.gray(`  Enhance:   yes`));
       }
       console.error(pc.gray(`  Split at:  ${config.maxDurationSeconds}s`));
+      if (config.parallelFiles > 1) {
+        console.error(pc.gray(`  Parallel:  ${config.parallelFiles} files`));
+      }
       console.error("");
     }
 
     // Run pipeline
-    const onProgress = jsonMode ? createJsonProgress() : createHumanProgress();
+    const onProgress = jsonMode
+      ? createJsonProgress()
+      : config.parallelFiles > 1
+        ? createBufferedProgress()
+        : createHumanProgress();
     const result = await runPipeline(config, backend, onProgress);
 
     // Output results
@@ -15,6 +15,11 @@ describe("quality presets", () => {
     expect(modelForPreset("accurate", "whisper-local", "base")).toBe("large-v2");
   });
 
+  it("maps local presets to faster-whisper models", () => {
+    expect(modelForPreset("accurate", "faster-whisper", "large-v2")).toBe("large-v2");
+    expect(modelForPreset("fast", "faster-whisper", "large-v2")).toBe("base");
+  });
+
   it("uses the backend default for non-local backends", () => {
     expect(modelForPreset("accurate", "whisper-api", "whisper-1")).toBe("whisper-1");
   });
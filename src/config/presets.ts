@@ -17,7 +17,7 @@ export function modelForPreset(
   backendName: string,
   backendDefaultModel: string,
 ): string {
-  if (backendName === "whisper-local") {
+  if (backendName === "whisper-local" || backendName === "faster-whisper") {
     return LOCAL_PRESET_MODELS[preset];
   }
 
@@ -12,6 +12,8 @@ describe("configSchema", () => {
     expect(config.maxDurationSeconds).toBe(1200);
     expect(config.enableAudioEnhancement).toBe(false);
     expect(config.keepIntermediateFiles).toBe(false);
+    expect(config.parallelFiles).toBe(1);
+    expect(config.computeType).toBe("auto");
     expect(config.outputFormats).toEqual(["txt", "srt"]);
   });
 
@@ -38,6 +40,14 @@ describe("configSchema", () => {
     expect(() => configSchema.parse({ maxDurationSeconds: -1 })).toThrow();
   });
 
+  it("rejects an unknown computeType", () => {
+    expect(() => configSchema.parse({ computeType: "int4" })).toThrow();
+  });
+
+  it("rejects a zero parallelFiles", () => {
+    expect(() => configSchema.parse({ parallelFiles: 0 })).toThrow();
+  });
+
   it("provides valid defaultConfig export", () => {
     expect(defaultConfig.backend).toBe("whisper-local");
     expect(defaultConfig.whisperModel).toBe("large-v2");
@@ -9,9 +9,13 @@ export const configSchema = z.object({
   backend: z.string().default("whisper-local"),
   whisperModel: z.string().default("large-v2"),
   device: z.enum(["auto", "cuda", "cpu"]).default("auto"),
+  computeType: z
+    .enum(["auto", "int8", "int8_float16", "int8_float32", "float16", "float32"])
+    .default("auto"),
   maxDurationSeconds: z.number().int().positive().default(1200),
   enableAudioEnhancement: z.boolean().default(false),
   keepIntermediateFiles: z.boolean().default(false),
+  parallelFiles: z.number().int().positive().default(1),
   outputFormats: z.array(outputFormatSchema).min(1).default(["txt", "srt"]),
 
   // Backend-specific config
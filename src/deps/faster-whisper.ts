@@ -0,0 +1,65 @@
+import { execa } from "execa";
+import type { DependencyStatus } from "../types/index.js";
+import { findPythonCommand } from "./whisper.js";
+
+export interface PythonCommand {
+  command: string;
+  args: string[];
+  display: string;
+}
+
+export interface FasterWhisperStatus extends DependencyStatus {
+  python?: PythonCommand;
+}
+
+export const FASTER_WHISPER_INSTALL_HINT =
+  "Run 'media-transcriber setup faster-whisper' or install it with: python -m pip install -U faster-whisper";
+
+/**
+ * Check whether the active Python can import faster-whisper.
+ * Only the package metadata is read, so this does not load CTranslate2.
+ */
+export async function discoverFasterWhisper(): Promise<FasterWhisperStatus> {
+  const python = await findPythonCommand();
+  if (!python) {
+    return {
+      available: false,
+      name: "faster-whisper",
+      error: "Python 3 not found in PATH",
+      installHint: FASTER_WHISPER_INSTALL_HINT,
+    };
+  }
+
+  try {
+    const result = await execa(
+      python.command,
+      [
+        ...python.args,
+        "-c",
+        "import importlib.metadata, importlib.util, sys;" +
+        'sys.exit(1) if importlib.util.find_spec("faster_whisper") is None ' +
+        'else print(importlib.metadata.version("faster-whisper"))',
+      ],
+      { timeout: 15_000, reject: false },
+    );
+    if (result.exitCode === 0) {
+      return {
+        available: true,
+        name: "faster-whisper",
+        version: `v${result.stdout.trim()} via ${python.display}`,
+        command: python.display,
+        python,
+      };
+    }
+  } catch {
+    // Fall through to the unavailable result below.
+  }
+
+  return {
+    available: false,
+    name: "faster-whisper",
+    error: `faster-whisper is not installed for ${python.display}`,
+    installHint: FASTER_WHISPER_INSTALL_HINT,
+    command: python.display,
+  };
+}
@@ -0,0 +1,24 @@
+import { describe, expect, it } from "vitest";
+import { createBufferedProgress } from "./progress.js";
+
+describe("createBufferedProgress", () => {
+  it("writes each file's lines in one piece when the file completes", () => {
+    const writes: string[] = [];
+    const onProgress = createBufferedProgress((text) => writes.push(text));
+
+    onProgress({ event: "file_start", file: "a.mp4", fileNumber: 1, totalFiles: 2 });
+    onProgress({ event: "file_start", file: "b.mp4", fileNumber: 2, totalFiles: 2 });
+    onProgress({ event: "step_complete", file: "a.mp4", step: "convert", message: "a done" });
+    onProgress({ event: "step_complete", file: "b.mp4", step: "convert", message: "b done" });
+    onProgress({ event: "file_complete", file: "b.mp4", success: false, error: "boom" });
+    onProgress({ event: "file_complete", file: "a.mp4", success: true });
+
+    expect(writes).toHaveLength(2);
+    expect(writes[0]).toContain("b.mp4");
+    expect(writes[0]).toContain("b done");
+    expect(writes[0]).toContain("boom");
+    expect(writes[0]).not.toContain("a done");
+    expect(writes[1]).toContain("a done");
+    expect(writes[1]).toContain("Complete");
+  });
+});
@@ -4,13 +4,12 @@ import type { ProgressEvent, PipelineStep } from "../types/index.js";
 import { formatProgressJson } from "./formatter.js";
 
 const stepLabels: Record<PipelineStep, string> = {
-  convert: "Converting to MP3",
+  convert: "Extracting audio",
   check_duration: "Checking duration",
   split: "Splitting audio",
   enhance: "Enhancing audio",
   transcribe: "Transcribing",
   merge: "Merging transcripts",
-  copy_output: "Copying output",
 };
 
 function stepText(step: PipelineStep, message?: string): string {
@@ -131,6 +130,59 @@ export function createSingleFileProgress(): (event: ProgressEvent) => void {
   };
 }
 
+/**
+ * Creates a progress callback for batches that process several files at once.
+ * Spinners would interleave, so each file's lines are collected and written
+ * in one piece when the file completes.
+ */
+export function createBufferedProgress(
+  write: (text: string) => void = (text) => process.stderr.write(text),
+): (event: ProgressEvent) => void {
+  const buffers = new Map<string, string[]>();
+
+  const append = (file: string, line: string) => {
+    let lines = buffers.get(file);
+    if (!lines) {
+      lines = [];
+      buffers.set(file, lines);
+    }
+    lines.push(line + "\n");
+  };
+
+  return (event: ProgressEvent) => {
+    switch (event.event) {
+      case "batch_start":
+        write(pc.cyan(`\nFound ${event.totalFiles} file(s) to transcribe\n\n`));
+        break;
+
+      case "file_start":
+        append(event.file, pc.green(`[${event.fileNumber}/${event.totalFiles}] ${event.file}`));
+        append(event.file, pc.gray("─".repeat(70)));
+        break;
+
+      case "step_complete":
+        append(event.file, `${pc.green("✔")} ${stepText(event.step, event.message)}`);
+        break;
+
+      case "file_complete": {
+        if (event.success) {
+          append(event.file, pc.green(`  ✓ Complete\n`));
+        } else {
+          append(event.file, pc.red(`  ✗ ERROR: ${event.error}\n`));
+        }
+        const lines = buffers.get(event.file)!;
+        buffers.delete(event.file);
+        write(lines.join(""));
+        break;
+      }
+
+      default:
+        // Step starts and progress updates only drive spinners
+        break;
+    }
+  };
+}
+
 /**
  * Creates a progress callback that emits NDJSON events to stderr (for AI agents).
  */
@@ -2,6 +2,16 @@ import { execa } from "execa";
 import { existsSync } from "node:fs";
 import { basename, extname, join } from "node:path";
 import { mkdir } from "node:fs/promises";
+import { FFMPEG_GLOBAL_ARGS, FFPROBE_GLOBAL_ARGS, runFfmpeg } from "./ffmpeg.js";
+
+/** Audio-only containers that backends read directly, without conversion */
+export const DIRECT_AUDIO_EXTENSIONS: readonly string[] = [".mp3", ".m4a", ".wav"];
+
+/** Stream-copy targets for audio codecs that can leave a video container as-is */
+const REMUX_TARGETS: Record<string, { ext: string; args: string[] }> = {
+  aac: { ext: ".m4a", args: ["-movflags", "+faststart"] },
+  mp3: { ext: ".mp3", args: [] },
+};
 
 /**
  * Convert audio/video file to MP3 format using ffmpeg.
@@ -21,7 +31,9 @@ export async function convertToMp3(
   const stem = basename(inputFile, extname(inputFile));
   const outputFile = join(outputFolder, `${stem}.mp3`);
 
-  await execa("ffmpeg", [
+  // Input may be any container, so probing keeps ffmpeg's defaults
+  await runFfmpeg([
+    ...FFMPEG_GLOBAL_ARGS,
     "-i", inputFile,
     "-vn",
     "-codec:a", "libmp3lame",
@@ -36,3 +48,68 @@ export async function convertToMp3(
 
   return outputFile;
 }
+
+/**
+ * Get the codec name of the first audio stream using ffprobe.
+ * Returns null when the file has no audio stream.
+ */
+export async function getAudioCodec(inputFile: string): Promise<string | null> {
+  if (!existsSync(inputFile)) {
+    throw new Error(`Input file not found: ${inputFile}`);
+  }
+
+  const result = await execa("ffprobe", [
+    ...FFPROBE_GLOBAL_ARGS,
+    "-v", "error",
+    "-select_streams", "a:0",
+    "-show_entries", "stream=codec_name",
+    "-of", "default=noprint_wrappers=1:nokey=1",
+    inputFile,
+  ]);
+
+  const codec = result.stdout.trim().split(/\r?\n/)[0]?.trim();
+  return codec ? codec.toLowerCase() : null;
+}
+
+/**
+ * Extract the audio track of a media file into a format backends accept.
+ * AAC and MP3 streams are copied without re-encoding; anything else is
+ * converted to MP3.
+ */
+export async function extractAudio(
+  inputFile: string,
+  outputFolder: string,
+  quality = 2,
+): Promise<string> {
+  const codec = await getAudioCodec(inputFile);
+  if (!codec) {
+    throw new Error(`No audio stream found in ${inputFile}`);
+  }
+
+  const remux = REMUX_TARGETS[codec];
+  if (!remux) {
+    return convertToMp3(inputFile, outputFolder, quality);
+  }
+
+  await mkdir(outputFolder, { recursive: true });
+
+  const stem = basename(inputFile, extname(inputFile));
+  const outputFile = join(outputFolder, `${stem}${remux.ext}`);
+
+  await runFfmpeg([
+    ...FFMPEG_GLOBAL_ARGS,
+    "-i", inputFile,
+    "-vn",
+    "-map", "0:a:0",
+    "-c:a", "copy",
+    ...remux.args,
+    "-y",
+    outputFile,
+  ]);
+
+  if (!existsSync(outputFile)) {
+    throw new Error("Audio extraction failed: output file not created");
+  }
+
+  return outputFile;
+}
@@ -1,16 +1,26 @@
-import { execa } from "execa";
 import { existsSync } from "node:fs";
 import { mkdir } from "node:fs/promises";
 import { basename, extname, join } from "node:path";
+import { FFMPEG_GLOBAL_ARGS, runFfmpeg } from "./ffmpeg.js";
+
+/** Enhancement filter chain: noise reduction → compression → dynamic normalization */
+export const AUDIO_FILTER = [
+  "afftdn=nf=-20",
+  "acompressor=ratio=4:threshold=0.1:attack=10:release=100",
+  "dynaudnorm=f=150:g=15:p=0.95",
+].join(",");
 
 /**
- * Enhance audio quality using ffmpeg filter chain.
- * Applies: noise reduction → compression → loudness normalization.
- * Port of lib/audio_enhancer.py enhance_audio()
+ * Extract, enhance and encode audio to MP3 in a single ffmpeg pass, so no
+ * intermediate MP3 is written between conversion and enhancement.
+ * `threads` caps the filter graph's worker threads (0 = automatic); the
+ * MP3 encoder itself is single-threaded.
  */
-export async function enhanceAudio(
+export async function convertAndEnhance(
   inputFile: string,
   outputFolder: string,
+  quality = 2,
+  threads = 0,
 ): Promise<string> {
   if (!existsSync(inputFile)) {
     throw new Error(`Input file not found: ${inputFile}`);
@@ -18,19 +28,18 @@ export async function enhanceAudio(
 
   await mkdir(outputFolder, { recursive: true });
 
-  const ext = extname(inputFile);
-  const stem = basename(inputFile, ext);
-  const outputFile = join(outputFolder, `${stem}_enhanced${ext}`);
-
-  const audioFilter = [
-    "afftdn=nf=-20",
-    "acompressor=ratio=4:threshold=0.1:attack=10:release=100",
-    "loudnorm=I=-16:LRA=11:tp=-1.5",
-  ].join(",");
+  const stem = basename(inputFile, extname(inputFile));
+  const outputFile = join(outputFolder, `${stem}_enhanced.mp3`);
 
-  await execa("ffmpeg", [
+  // Input may be any container, so probing keeps ffmpeg's defaults
+  await runFfmpeg([
+    ...FFMPEG_GLOBAL_ARGS,
+    "-filter_threads", String(threads),
     "-i", inputFile,
-    "-af", audioFilter,
+    "-vn",
+    "-af", AUDIO_FILTER,
+    "-codec:a", "libmp3lame",
+    "-q:a", String(quality),
     "-y",
     outputFile,
   ]);
@@ -0,0 +1,65 @@
+import { describe, expect, it } from "vitest";
+import { parseMp3Duration, parseWavDuration } from "./audio-header.js";
+
+function wavHeader(byteRate: number, dataSize: number): Buffer {
+  const header = Buffer.alloc(44);
+  header.write("RIFF", 0, "ascii");
+  header.writeUInt32LE(Math.min(36 + dataSize, 0xffffffff), 4);
+  header.write("WAVE", 8, "ascii");
+  header.write("fmt ", 12, "ascii");
+  header.writeUInt32LE(16, 16);
+  header.writeUInt16LE(1, 20); // PCM
+  header.writeUInt16LE(1, 22); // mono
+  header.writeUInt32LE(byteRate / 2, 24);
+  header.writeUInt32LE(byteRate, 28);
+  header.writeUInt16LE(2, 32);
+  header.writeUInt16LE(16, 34);
+  header.write("data", 36, "ascii");
+  header.writeUInt32LE(dataSize, 40);
+  return header;
+}
+
+/** MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo frame with an Info header */
+function mp3Header(frames: number): Buffer {
+  const frame = Buffer.alloc(417);
+  frame.writeUInt32BE(0xfffb9000, 0);
+  frame.write("Info", 36, "ascii");
+  frame.writeUInt32BE(0x1, 40);
+  frame.writeUInt32BE(frames, 44);
+  return frame;
+}
+
+describe("parseWavDuration", () => {
+  it("reads duration from the data chunk size", () => {
+    expect(parseWavDuration(wavHeader(32000, 80000), 44 + 80000)).toBe(2.5);
+  });
+
+  it("uses the file size when the data size is unset", () => {
+    expect(parseWavDuration(wavHeader(32000, 0xffffffff), 44 + 64000)).toBe(2);
+  });
+
+  it("returns null for non-WAV data", () => {
+    expect(parseWavDuration(Buffer.from("not a wav file"), 14)).toBeNull();
+  });
+});
+
+describe("parseMp3Duration", () => {
+  it("reads the frame count from an Info header", () => {
+    expect(parseMp3Duration(mp3Header(1000))).toBeCloseTo((1000 * 1152) / 44100, 6);
+  });
+
+  it("skips a leading ID3v2 tag", () => {
+    const tag = Buffer.alloc(20);
+    tag.write("ID3", 0, "ascii");
+    tag[3] = 4;
+    tag[9] = 10; // 10-byte tag body
+    const buffer = Buffer.concat([tag, mp3Header(500)]);
+    expect(parseMp3Duration(buffer)).toBeCloseTo((500 * 1152) / 44100, 6);
+  });
+
+  it("returns null when there is no frame-count header", () => {
+    const frame = Buffer.alloc(417);
+    frame.writeUInt32BE(0xfffb9000, 0);
+    expect(parseMp3Duration(frame)).toBeNull();
+  });
+});
@@ -0,0 +1,143 @@
+import { open } from "node:fs/promises";
+import { extname } from "node:path";
+
+/** Bytes read from the start of a file when looking for a duration header */
+const HEADER_READ_BYTES = 64 * 1024;
+
+/** MPEG audio sample rates by version, indexed by the header's rate bits */
+const MPEG_SAMPLE_RATES: Record<number, number[]> = {
+  3: [44100, 48000, 32000], // MPEG-1
+  2: [22050, 24000, 16000], // MPEG-2
+  0: [11025, 12000, 8000], // MPEG-2.5
+};
+
+/**
+ * Read the duration (seconds) of a WAV file from its RIFF header.
+ * Returns null when the header is incomplete or the size is unknown.
+ */
+export function parseWavDuration(header: Buffer, fileSize: number): number | null {
+  if (
+    header.length < 12 ||
+    header.toString("ascii", 0, 4) !== "RIFF" ||
+    header.toString("ascii", 8, 12) !== "WAVE"
+  ) {
+    return null;
+  }
+
+  let byteRate = 0;
+  let offset = 12;
+
+  while (offset + 8 <= header.length) {
+    const chunkId = header.toString("ascii", offset, offset + 4);
+    const chunkSize = header.readUInt32LE(offset + 4);
+    const dataStart = offset + 8;
+
+    if (chunkId === "fmt " && dataStart + 12 <= header.length) {
+      byteRate = header.readUInt32LE(dataStart + 8);
+    } else if (chunkId === "data") {
+      if (!byteRate) return null;
+      // Streamed WAVs leave the size unset; trust the real file size instead
+      const available = fileSize - dataStart;
+      const dataSize = chunkSize === 0xffffffff || chunkSize > available
+        ? available
+        : chunkSize;
+      return dataSize > 0 ? dataSize / byteRate : null;
+    }
+
+    // Chunks are padded to an even number of bytes
+    offset = dataStart + chunkSize + (chunkSize % 2);
+  }
+
+  return null;
+}
+
+/**
+ * Read the duration (seconds) of an MP3 file from its Xing/Info or VBRI
+ * frame-count header, as written by LAME and ffmpeg's mp3 muxer.
+ * Returns null when no frame-count header is present.
+ */
+export function parseMp3Duration(header: Buffer): number | null {
+  let offset = 0;
+
+  // Skip an ID3v2 tag (syncsafe size, optional 10-byte footer)
+  if (header.length >= 10 && header.toString("ascii", 0, 3) === "ID3") {
+    const size =
+      ((header[6]! & 0x7f) << 21) |
+      ((header[7]! & 0x7f) << 14) |
+      ((header[8]! & 0x7f) << 7) |
+      (header[9]! & 0x7f);
+    const hasFooter = (header[5]! & 0x10) !== 0;
+    offset = 10 + size + (hasFooter ? 10 : 0);
+  }
+
+  // Find the first frame sync
+  while (
+    offset + 4 <= header.length &&
+    !(header[offset] === 0xff && (header[offset + 1]! & 0xe0) === 0xe0)
+  ) {
+    offset++;
+  }
+  if (offset + 4 > header.length) return null;
+
+  const frameHeader = header.readUInt32BE(offset);
+  const version = (frameHeader >>> 19) & 0x3;
+  const layer = (frameHeader >>> 17) & 0x3;
+  const rateIndex = (frameHeader >>> 10) & 0x3;
+  const channelMode = (frameHeader >>> 6) & 0x3;
+
+  const sampleRate = MPEG_SAMPLE_RATES[version]?.[rateIndex];
+  // Only Layer III (layer bits 01) carries these headers
+  if (!sampleRate || layer !== 1) return null;
+
+  const isMpeg1 = version === 3;
+  const mono = channelMode === 3;
+  const samplesPerFrame = isMpeg1 ? 1152 : 576;
+  const sideInfoSize = isMpeg1 ? (mono ? 17 : 32) : (mono ? 9 : 17);
+
+  let frames: number | null = null;
+
+  const xingOffset = offset + 4 + sideInfoSize;
+  const vbriOffset = offset + 4 + 32;
+  if (xingOffset + 12 <= header.length) {
+    const tag = header.toString("ascii", xingOffset, xingOffset + 4);
+    if (tag === "Xing" || tag === "Info") {
+      const flags = header.readUInt32BE(xingOffset + 4);
+      if (flags & 0x1) {
+        frames = header.readUInt32BE(xingOffset + 8);
+      }
+    }
+  }
+  if (
+    frames === null &&
+    vbriOffset + 18 <= header.length &&
+    header.toString("ascii", vbriOffset, vbriOffset + 4) === "VBRI"
+  ) {
+    frames = header.readUInt32BE(vbriOffset + 14);
+  }
+
+  return frames ? (frames * samplesPerFrame) / sampleRate : null;
+}
+
+/**
+ * Read an audio file's duration from its container header without spawning
+ * ffprobe. Supports WAV and MP3 with a frame-count header; returns null for
+ * anything else so callers can fall back to ffprobe.
+ */
+export async function readHeaderDuration(inputFile: string): Promise<number | null> {
+  const ext = extname(inputFile).toLowerCase();
+  if (ext !== ".wav" && ext !== ".mp3") return null;
+
+  const handle = await open(inputFile, "r");
+  try {
+    const { size } = await handle.stat();
+    const buffer = Buffer.alloc(Math.min(HEADER_READ_BYTES, size));
+    const { bytesRead } = await handle.read(buffer, 0, buffer.length, 0);
+    const header = buffer.subarray(0, bytesRead);
+
+    return ext === ".wav"
+      ? parseWavDuration(header, size)
+      : parseMp3Duration(header);
+  } finally {
+    await handle.close();
+  }
+}
@@ -0,0 +1,98 @@
+import { describe, expect, it } from "vitest";
+import { mkdtemp, readFile, rm, writeFile } from "node:fs/promises";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
+import {
+  cutSearchWindow,
+  orderCutPoints,
+  parseSilences,
+  pickCutPoint,
+  splitAudio,
+} from "./audio-splitter.js";
+
+describe("parseSilences", () => {
+  it("parses silencedetect output with a window offset", () => {
+    const log = [
+      "[silencedetect @ 0x1] silence_start: 2.5",
+      "[silencedetect @ 0x1] silence_end: 3.1 | silence_duration: 0.6",
+      "[silencedetect @ 0x1] silence_start: 10",
+      "[silencedetect @ 0x1] silence_end: 11 | silence_duration: 1",
+    ].join("\n");
+
+    expect(parseSilences(log, 100)).toEqual([
+      { start: 102.5, end: 103.1 },
+      { start: 110, end: 111 },
+    ]);
+  });
+
+  it("closes a silence that runs to the end of the window", () => {
+    const log = "[silencedetect @ 0x1] silence_start: 28.2\n";
+    expect(parseSilences(log, 0, 30)).toEqual([{ start: 28.2, end: 30 }]);
+  });
+
+  it("clamps slightly negative starts to zero", () => {
+    const log = "silence_start: -0.01\nsilence_end: 0.5 | silence_duration: 0.51\n";
+    expect(parseSilences(log)).toEqual([{ start: 0, end: 0.5 }]);
+  });
+});
+
+describe("pickCutPoint", () => {
+  it("snaps to the closest silence midpoint", () => {
+    const silences = [
+      { start: 590, end: 592 },
+      { start: 603, end: 605 },
+    ];
+    expect(pickCutPoint(600, silences)).toBe(604);
+  });
+
+  it("keeps the target when no silence is within the window", () => {
+    expect(pickCutPoint(600, [{ start: 500, end: 501 }])).toBe(600);
+  });
+});
+
+describe("cutSearchWindow", () => {
+  it("searches 15s around cuts of long parts", () => {
+    expect(cutSearchWindow(600)).toBe(15);
+  });
+
+  it("caps the window at half a part for short parts", () => {
+    expect(cutSearchWindow(10)).toBe(5);
+  });
+});
+
+describe("orderCutPoints", () => {
+  it("keeps snapped cuts that are in order", () => {
+    expect(orderCutPoints([600, 1200], [604, 1195], 1800)).toEqual([604, 1195]);
+  });
+
+  it("falls back to the target when a snapped cut goes backwards", () => {
+    expect(orderCutPoints([10, 20], [19, 12], 30)).toEqual([19, 20]);
+  });
+
+  it("keeps cuts strictly increasing when the target is behind the previous cut", () => {
+    const cuts = orderCutPoints([10, 20], [20.5, 19], 30);
+    expect(cuts[0]).toBe(20.5);
+    expect(cuts[1]).toBeCloseTo(20.51, 5);
+  });
+
+  it("falls back to the target when a snapped cut is past the end", () => {
+    expect(orderCutPoints([15], [31], 30)).toEqual([15]);
+  });
+});
+
+describe("splitAudio", () => {
+  it("returns the whole file as a single part", async () => {
+    const dir = await mkdtemp(join(tmpdir(), "split-"));
+    try {
+      const input = join(dir, "talk.mp3");
+      await writeFile(input, Buffer.from("full audio"));
+
+      const parts = await splitAudio(input, 1, join(dir, "out"), "talk");
+
+      expect(parts).toEqual([{ file: join(dir, "out", "talk_part01.mp3"), startSeconds: 0 }]);
+      expect(await readFile(parts[0]!.file, "utf-8")).toBe("full audio");
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+});
@@ -1,10 +1,18 @@
 import { execa } from "execa";
-import { existsSync } from "node:fs";
-import { mkdir } from "node:fs/promises";
+import { existsSync, statSync } from "node:fs";
+import { copyFile, mkdir } from "node:fs/promises";
 import { basename, extname, join } from "node:path";
+import { readHeaderDuration } from "./audio-header.js";
+import { DIRECT_AUDIO_EXTENSIONS } from "./audio-converter.js";
+import { FFMPEG_GLOBAL_ARGS, FFPROBE_GLOBAL_ARGS, fastProbeArgs, runFfmpeg } from "./ffmpeg.js";
+
+/** Durations already read this run, keyed by path, size and mtime */
+const durationCache = new Map<string, Promise<number>>();
 
 /**
- * Get audio duration in seconds using ffprobe.
+ * Get audio duration in seconds.
+ * Reads WAV/MP3 headers directly and falls back to ffprobe; results are
+ * cached so a file probed before splitting is not probed again.
  * Port of lib/audio_splitter.py get_audio_duration()
  */
 export async function getAudioDuration(inputFile: string): Promise<number> {
@@ -12,7 +20,30 @@ export async function getAudioDuration(inputFile: string): Promise<number> {
     throw new Error(`Input file not found: ${inputFile}`);
   }
 
+  const { size, mtimeMs } = statSync(inputFile);
+  const key = `${inputFile}\0${size}\0${mtimeMs}`;
+
+  let pending = durationCache.get(key);
+  if (!pending) {
+    pending = readDuration(inputFile);
+    durationCache.set(key, pending);
+    pending.catch(() => durationCache.delete(key));
+  }
+
+  return pending;
+}
+
+async function readDuration(inputFile: string): Promise<number> {
+  const headerDuration = await readHeaderDuration(inputFile).catch(() => null);
+  if (headerDuration !== null) {
+    return headerDuration;
+  }
+
+  // Video containers may need full probing to report a duration
+  const knownAudio = DIRECT_AUDIO_EXTENSIONS.includes(extname(inputFile).toLowerCase());
   const result = await execa("ffprobe", [
+    ...FFPROBE_GLOBAL_ARGS,
+    ...(knownAudio ? fastProbeArgs() : []),
     "-v", "error",
     "-show_entries", "format=duration",
     "-of", "default=noprint_wrappers=1:nokey=1",
@@ -27,8 +58,165 @@ export async function getAudioDuration(inputFile: string): Promise<number> {
   return duration;
 }
 
+/** Seconds searched on each side of an equal-length cut point for silence */
+const SILENCE_SEARCH_WINDOW = 15;
+
+/** Smallest gap kept between consecutive cut points (seconds) */
+const MIN_CUT_GAP = 0.01;
+
+/** ffmpeg silencedetect settings used to find cut points */
+const SILENCE_FILTER = "silencedetect=noise=-35dB:d=0.3";
+
+const SILENCE_START_RE = /silence_start:\s*(-?[\d.]+)/;
+const SILENCE_END_RE = /silence_end:\s*(-?[\d.]+)/;
+
+/** A silent span in seconds */
+export interface Silence {
+  start: number;
+  end: number;
+}
+
+/** A split output file and where it starts in the source audio */
+export interface SplitPart {
+  file: string;
+  startSeconds: number;
+}
+
+/**
+ * Parse ffmpeg silencedetect log output into silent spans.
+ * `offset` is added to every time (for windows read with input seeking);
+ * a silence still open at the end of the log is closed at `windowEnd`.
+ */
+export function parseSilences(log: string, offset = 0, windowEnd = Infinity): Silence[] {
+  const silences: Silence[] = [];
+  let openStart: number | null = null;
+
+  for (const line of log.split(/\r?\n/)) {
+    const startMatch = SILENCE_START_RE.exec(line);
+    if (startMatch) {
+      openStart = Math.max(0, Number.parseFloat(startMatch[1]!)) + offset;
+      continue;
+    }
+
+    const endMatch = SILENCE_END_RE.exec(line);
+    if (endMatch && openStart !== null) {
+      silences.push({ start: openStart, end: Number.parseFloat(endMatch[1]!) + offset });
+      openStart = null;
+    }
+  }
+
+  if (openStart !== null && Number.isFinite(windowEnd)) {
+    silences.push({ start: openStart, end: windowEnd });
+  }
+
+  return silences;
+}
+
+/**
+ * Pick the silence midpoint closest to `target` within ±`window` seconds.
+ * Returns `target` unchanged when no silence is close enough.
+ */
+export function pickCutPoint(
+  target: number,
+  silences: Silence[],
+  window = SILENCE_SEARCH_WINDOW,
+): number {
+  let best = target;
+  let bestDistance = Infinity;
+
+  for (const silence of silences) {
+    const mid = (silence.start + silence.end) / 2;
+    const distance = Math.abs(mid - target);
+    if (distance <= window && distance < bestDistance) {
+      best = mid;
+      bestDistance = distance;
+    }
+  }
+
+  return best;
+}
+
 /**
- * Split audio file into multiple equal-length parts.
+ * Silence search window for parts of `partDuration` seconds. Capped at half a
+ * part so a snapped cut cannot pass the next part's equal-length target.
+ */
+export function cutSearchWindow(partDuration: number): number {
+  return Math.min(SILENCE_SEARCH_WINDOW, partDuration / 2);
+}
+
+/**
+ * Turn snapped cut points into a strictly increasing list inside the file.
+ * A snapped cut that is out of order or out of range falls back to its
+ * equal-length target, moved past the previous cut if needed, since ffmpeg
+ * rejects non-increasing segment times.
+ */
+export function orderCutPoints(targets: number[], snapped: number[], duration: number): number[] {
+  const cutPoints: number[] = [];
+  let previous = 0;
+  for (let i = 0; i < targets.length; i++) {
+    const candidate = snapped[i]!;
+    const cut = candidate >= previous + MIN_CUT_GAP && candidate < duration
+      ? candidate
+      : Math.max(targets[i]!, previous + MIN_CUT_GAP);
+    cutPoints.push(cut);
+    previous = cut;
+  }
+  return cutPoints;
+}
+
+/**
+ * Find silences within ±`window` seconds of `target` by decoding only that window.
+ */
+async function findSilencesNear(inputFile: string, target: number, window: number): Promise<Silence[]> {
+  const from = Math.max(0, target - window);
+  const length = target + window - from;
+
+  // The silencedetect log is the result here, and a short window keeps it small
+  const result = await execa("ffmpeg", [
+    ...FFMPEG_GLOBAL_ARGS,
+    ...fastProbeArgs(),
+    "-ss", from.toFixed(3),
+    "-t", length.toFixed(3),
+    "-i", inputFile,
+    "-vn",
+    "-af", SILENCE_FILTER,
+    "-f", "null",
+    "-",
+  ], { reject: false });
+
+  return parseSilences(result.stderr, from, from + length);
+}
+
+/**
+ * Compute cut points for `numParts` parts: equal-length targets snapped to
+ * the nearest silence, so cuts do not land mid-word. Falls back to the
+ * equal-length target when no silence is found or the order would break.
+ */
+async function findCutPoints(
+  inputFile: string,
+  duration: number,
+  numParts: number,
+): Promise<number[]> {
+  const partDuration = duration / numParts;
+  const targets = Array.from({ length: numParts - 1 }, (_, idx) => (idx + 1) * partDuration);
+
+  const window = cutSearchWindow(partDuration);
+
+  const snapped = await Promise.all(
+    targets.map(async (target) =>
+      pickCutPoint(target, await findSilencesNear(inputFile, target, window), window),
+    ),
+  );
+
+  return orderCutPoints(targets, snapped, duration);
+}
+
+/**
+ * Split audio file into `numParts` parts of roughly equal length.
+ * Cuts are moved to the nearest silence (within 15s, or half a part for
+ * short parts) and done in a single
+ * pass with ffmpeg's segment muxer. Each part reports its start time in
+ * the source so transcripts can be merged with exact offsets.
  * Port of lib/audio_splitter.py split_audio()
  */
 export async function splitAudio(
@@ -36,7 +224,7 @@ export async function splitAudio(
   numParts: number,
   outputFolder: string,
   outputPrefix?: string,
-): Promise<string[]> {
+): Promise<SplitPart[]> {
   if (!existsSync(inputFile)) {
     throw new Error(`Input file not found: ${inputFile}`);
   }
@@ -50,36 +238,52 @@ export async function splitAudio(
   const stem = basename(inputFile, ext);
   const prefix = outputPrefix || stem;
 
+  // Without -segment_times the segment muxer falls back to 2s segments, so a
+  // single part is a plain full-length copy
+  if (numParts === 1) {
+    const outputFile = join(outputFolder, `${prefix}_part01${ext}`);
+    await copyFile(inputFile, outputFile);
+    return [{ file: outputFile, startSeconds: 0 }];
+  }
+
   const duration = await getAudioDuration(inputFile);
-  const partDuration = duration / numParts;
 
-  const splitFiles: string[] = [];
+  // Cut points between parts; the last part runs to the end of the file
+  const cutPoints = await findCutPoints(inputFile, duration, numParts);
+
+  // The segment muxer expands %02d in the output path, so escape literal '%'
+  const pattern = `${join(outputFolder, `${prefix}_part`).replaceAll("%", "%%")}%02d${ext}`;
+  // Stream copy only needs the container header, so probe even less
+  const args = [
+    ...FFMPEG_GLOBAL_ARGS,
+    ...fastProbeArgs("16k"),
+    "-i", inputFile,
+    "-map", "0:a",
+    "-c", "copy",
+    "-f", "segment",
+    "-segment_start_number", "1",
+    "-reset_timestamps", "1",
+    "-segment_times", cutPoints.map((t) => t.toFixed(3)).join(","),
+    "-y",
+    pattern,
+  ];
 
+  await runFfmpeg(args);
+
+  const splitParts: SplitPart[] = [];
   for (let i = 1; i <= numParts; i++) {
-    const startTime = (i - 1) * partDuration;
     const partNum = String(i).padStart(2, "0");
     const outputFile = join(outputFolder, `${prefix}_part${partNum}${ext}`);
 
-    const args = [
-      "-i", inputFile,
-      "-ss", String(startTime),
-    ];
-
-    // Last part: go to end of file; others: specify duration
-    if (i < numParts) {
-      args.push("-t", String(partDuration));
-    }
-
-    args.push("-c", "copy", "-y", outputFile);
-
-    await execa("ffmpeg", args);
-
     if (!existsSync(outputFile)) {
       throw new Error(`Split failed: output file not created for part ${i}`);
     }
 
-    splitFiles.push(outputFile);
+    splitParts.push({
+      file: outputFile,
+      startSeconds: i === 1 ? 0 : cutPoints[i - 2]!,
+    });
   }
 
-  return splitFiles;
+  return splitParts;
 }
@@ -0,0 +1,56 @@
+import { describe, expect, it } from "vitest";
+import { createLimiter, mapWithConcurrency } from "./concurrency.js";
+
+function delay(ms: number): Promise<void> {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+describe("createLimiter", () => {
+  it("never runs more than the allowed number of tasks", async () => {
+    const limit = createLimiter(2);
+    let active = 0;
+    let peak = 0;
+
+    await Promise.all(
+      [1, 2, 3, 4, 5].map(() =>
+        limit(async () => {
+          active++;
+          peak = Math.max(peak, active);
+          await delay(5);
+          active--;
+        }),
+      ),
+    );
+
+    expect(peak).toBe(2);
+  });
+
+  it("keeps running queued tasks after a failure", async () => {
+    const limit = createLimiter(1);
+    const failed = limit(async () => {
+      throw new Error("boom");
+    });
+
+    await expect(failed).rejects.toThrow("boom");
+    await expect(limit(async () => "next")).resolves.toBe("next");
+  });
+
+  it("rejects a concurrency below one", () => {
+    expect(() => createLimiter(0)).toThrow();
+  });
+});
+
+describe("mapWithConcurrency", () => {
+  it("returns results in input order", async () => {
+    const results = await mapWithConcurrency([30, 10, 20], 3, async (ms, i) => {
+      await delay(ms);
+      return i;
+    });
+
+    expect(results).toEqual([0, 1, 2]);
+  });
+
+  it("handles an empty list", async () => {
+    expect(await mapWithConcurrency([], 4, async () => 1)).toEqual([]);
+  });
+});
@@ -0,0 +1,47 @@
+/** Runs a task once a slot is free and resolves with its result */
+export type Limiter = <T>(task: () => Promise<T>) => Promise<T>;
+
+/**
+ * Create a limiter that allows at most `concurrency` tasks to run at once.
+ * Queued tasks start in submission order.
+ */
+export function createLimiter(concurrency: number): Limiter {
+  if (concurrency < 1) {
+    throw new Error("concurrency must be at least 1");
+  }
+
+  let active = 0;
+  const queue: Array<() => void> = [];
+
+  const release = () => {
+    active--;
+    queue.shift()?.();
+  };
+
+  return <T>(task: () => Promise<T>): Promise<T> =>
+    new Promise<T>((resolve, reject) => {
+      const run = () => {
+        active++;
+        Promise.resolve().then(task).then(resolve, reject).finally(release);
+      };
+
+      if (active < concurrency) {
+        run();
+      } else {
+        queue.push(run);
+      }
+    });
+}
+
+/**
+ * Map items through an async function with at most `concurrency` calls in flight.
+ * Results keep the order of the input items.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  concurrency: number,
+  fn: (item: T, index: number) => Promise<R>,
+): Promise<R[]> {
+  const limit = createLimiter(Math.max(1, Math.min(concurrency, items.length)));
+  return Promise.all(items.map((item, i) => limit(() => fn(item, i))));
+}
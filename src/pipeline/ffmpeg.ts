@@ -0,0 +1,69 @@
+import { spawn } from "node:child_process";
+import { cpus } from "node:os";
+
+/** Characters of ffmpeg stderr kept for error messages */
+const STDERR_TAIL_CHARS = 64 * 1024;
+
+/**
+ * Global ffmpeg options for every pipeline run: skip the banner and progress
+ * stats, and never read stdin (a stray keypress would otherwise be taken as
+ * a command).
+ */
+export const FFMPEG_GLOBAL_ARGS = ["-hide_banner", "-nostdin", "-nostats"];
+
+/** Global ffprobe options (ffprobe has no -nostdin) */
+export const FFPROBE_GLOBAL_ARGS = ["-hide_banner"];
+
+/**
+ * Input options that cap stream analysis for audio files whose container is
+ * already known. Must be placed before `-i`.
+ * Note: `-analyzeduration 0` means "use the default" in ffmpeg, so a small
+ * explicit window is used instead.
+ */
+export function fastProbeArgs(probeSize = "32k"): string[] {
+  return ["-probesize", probeSize, "-analyzeduration", "500000"];
+}
+
+/**
+ * Filter-graph thread count (`-filter_threads`) for each enhancement run when
+ * `parallelFiles` files are processed at once, so concurrent filter graphs
+ * split the cores instead of each claiming all of them. Returns 0 (ffmpeg's
+ * automatic choice) for sequential runs.
+ */
+export function ffmpegThreadsFor(parallelFiles: number): number {
+  if (parallelFiles <= 1) return 0;
+  return Math.max(1, Math.floor(cpus().length / parallelFiles));
+}
+
+/**
+ * Run ffmpeg with stdout discarded and only the tail of stderr kept, so long
+ * runs do not buffer their whole log. Rejects with the tail on a nonzero exit.
+ */
+export function runFfmpeg(args: string[]): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const child = spawn("ffmpeg", args, {
+      stdio: ["ignore", "ignore", "pipe"],
+      windowsHide: true,
+    });
+
+    let stderrTail = "";
+    child.stderr.setEncoding("utf-8");
+    child.stderr.on("data", (chunk: string) => {
+      stderrTail += chunk;
+      if (stderrTail.length > STDERR_TAIL_CHARS * 2) {
+        stderrTail = stderrTail.slice(-STDERR_TAIL_CHARS);
+      }
+    });
+
+    child.on("error", reject);
+    child.on("close", (code, signal) => {
+      if (code === 0) {
+        resolve();
+        return;
+      }
+      const tail = stderrTail.slice(-STDERR_TAIL_CHARS).trim();
+      const status = signal ? `was killed with ${signal}` : `exited with code ${code}`;
+      reject(new Error(`ffmpeg ${status}${tail ? `\n${tail}` : ""}`));
+    });
+  });
+}
@@ -1,8 +1,15 @@
 import { describe, expect, it } from "vitest";
+import { mkdtemp, rm, writeFile } from "node:fs/promises";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
 import {
   calculateSplitParts,
   calculateSplitPartsForConstraints,
+  canReadInputDirectly,
+  transcribeParts,
 } from "./orchestrator.js";
+import type { TranscribeOptions, TranscriptionBackend } from "../backends/types.js";
+import type { ProgressEvent } from "../types/index.js";
 
 describe("calculateSplitParts", () => {
   it("does not over-split exact multiples", () => {
@@ -31,3 +38,112 @@ describe("calculateSplitPartsForConstraints", () => {
     expect(calculateSplitPartsForConstraints(300, 600, 50, 100)).toBe(1);
   });
 });
+
+describe("canReadInputDirectly", () => {
+  it("reads plain audio directly when it fits the backend limit", async () => {
+    const dir = await mkdtemp(join(tmpdir(), "direct-"));
+    try {
+      const wav = join(dir, "talk.wav");
+      await writeFile(wav, Buffer.alloc(1000));
+      expect(await canReadInputDirectly(wav, {}, 1200)).toBe(true);
+      expect(await canReadInputDirectly(wav, { maxInputBytes: 1000 }, 1200)).toBe(true);
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+
+  it("converts plain audio that is over the backend limit", async () => {
+    const dir = await mkdtemp(join(tmpdir(), "direct-"));
+    try {
+      const wav = join(dir, "talk.wav");
+      await writeFile(wav, Buffer.alloc(1000));
+      expect(await canReadInputDirectly(wav, { maxInputBytes: 999 }, 1200)).toBe(false);
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+
+  it("extracts audio from containers the backend cannot decode", async () => {
+    const dir = await mkdtemp(join(tmpdir(), "direct-"));
+    try {
+      const video = join(dir, "talk.mp4");
+      await writeFile(video, Buffer.alloc(1000));
+      expect(await canReadInputDirectly(video, {}, 1200)).toBe(false);
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+});
+
+describe("transcribeParts", () => {
+  function fakeBackend(withBatch: boolean) {
+    const calls: string[] = [];
+    const toSegment = (options: TranscribeOptions) => ({
+      txtFile: `${options.outputDir}/out.txt`,
+      srtFile: null,
+      partNumber: 0,
+    });
+    const backend: TranscriptionBackend = {
+      name: "fake",
+      displayName: "Fake",
+      defaultModel: "tiny",
+      checkAvailability: async () => ({ available: true, name: "fake" }),
+      transcribe: async (options) => {
+        calls.push(`single:${options.inputFile}`);
+        return toSegment(options);
+      },
+      supportedModels: () => ["tiny"],
+      capabilities: () => ({}),
+      init: () => {},
+    };
+    if (withBatch) {
+      backend.transcribeBatch = async (options) => {
+        calls.push(`batch:${options.map((o) => o.inputFile).join(",")}`);
+        return options.map(toSegment);
+      };
+    }
+    return { backend, calls };
+  }
+
+  const parts = [1, 2, 3].map((n): TranscribeOptions => ({
+    inputFile: `talk_part0${n}.mp3`,
+    model: "tiny",
+    device: "cpu",
+    outputDir: `tmp/part0${n}`,
+    outputFormats: ["txt"],
+  }));
+
+  it("sends all split parts to transcribeBatch and maps part offsets", async () => {
+    const { backend, calls } = fakeBackend(true);
+    const events: ProgressEvent[] = [];
+
+    const segments = await transcribeParts(backend, parts, [0, 599.4, 1201.2345], "talk.mp4", (e) => events.push(e));
+
+    expect(calls).toEqual(["batch:talk_part01.mp3,talk_part02.mp3,talk_part03.mp3"]);
+    expect(segments.map((s) => s.partNumber)).toEqual([1, 2, 3]);
+    expect(segments.map((s) => s.offsetMs)).toEqual([0, 599400, 1201235]);
+    expect(segments[2]!.txtFile).toBe("tmp/part03/out.txt");
+    expect(events).toHaveLength(0);
+  });
+
+  it("transcribes part by part without transcribeBatch", async () => {
+    const { backend, calls } = fakeBackend(false);
+    const events: ProgressEvent[] = [];
+
+    const segments = await transcribeParts(backend, parts.slice(0, 2), [0, 600], "talk.mp4", (e) => events.push(e));
+
+    expect(calls).toEqual(["single:talk_part01.mp3", "single:talk_part02.mp3"]);
+    expect(segments.map((s) => s.offsetMs)).toEqual([0, 600000]);
+    expect(events).toHaveLength(2);
+  });
+
+  it("uses transcribe for an unsplit file even when batching is available", async () => {
+    const { backend, calls } = fakeBackend(true);
+
+    const segments = await transcribeParts(backend, parts.slice(0, 1), [0], "talk.mp4", () => {});
+
+    expect(calls).toEqual(["single:talk_part01.mp3"]);
+    expect(segments[0]!.partNumber).toBe(1);
+    expect(segments[0]!.offsetMs).toBe(0);
+  });
+});
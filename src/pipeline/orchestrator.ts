@@ -1,18 +1,25 @@
-import { readdir, cp, rm, mkdir } from "node:fs/promises";
+import { copyFile, mkdir, readdir, rename, rm } from "node:fs/promises";
 import { existsSync, statSync } from "node:fs";
 import { join, extname, basename } from "node:path";
 import type { Config } from "../config/schema.js";
-import type { TranscriptionBackend } from "../backends/types.js";
+import type {
+  BackendCapabilities,
+  TranscribeOptions,
+  TranscriptionBackend,
+} from "../backends/types.js";
 import type {
   FileResult,
   BatchResult,
   ProgressEvent,
+  TranscriptSegment,
 } from "../types/index.js";
 import { SUPPORTED_EXTENSIONS } from "../types/index.js";
-import { convertToMp3 } from "./audio-converter.js";
+import { DIRECT_AUDIO_EXTENSIONS, extractAudio } from "./audio-converter.js";
 import { getAudioDuration, splitAudio } from "./audio-splitter.js";
-import { enhanceAudio } from "./audio-enhancer.js";
+import { convertAndEnhance } from "./audio-enhancer.js";
 import { mergeTranscripts } from "./transcript-merger.js";
+import { createLimiter, mapWithConcurrency, type Limiter } from "./concurrency.js";
+import { ffmpegThreadsFor } from "./ffmpeg.js";
 
 export type ProgressCallback = (event: ProgressEvent) => void;
 
@@ -43,8 +50,12 @@ export function calculateSplitPartsForConstraints(
   return Math.max(durationParts, sizeParts);
 }
 
+const SUPPORTED_EXTENSION_SET: ReadonlySet<string> = new Set(SUPPORTED_EXTENSIONS);
+
 /**
  * Discover supported audio/video files in a directory (recursive).
+ * The tree is read in a single pass; sibling subdirectories are read
+ * concurrently.
  */
 export async function findInputFiles(inputFolder: string): Promise<string[]> {
   if (!existsSync(inputFolder)) {
@@ -53,27 +64,116 @@ export async function findInputFiles(inputFolder: string): Promise<string[]> {
 
   const files: string[] = [];
 
-  async function walk(dir: string) {
+  async function walk(dir: string): Promise<void> {
     const entries = await readdir(dir, { withFileTypes: true });
+    const subdirs: Promise<void>[] = [];
     for (const entry of entries) {
       const fullPath = join(dir, entry.name);
       if (entry.isDirectory()) {
-        await walk(fullPath);
-      } else {
-        const ext = extname(entry.name).toLowerCase();
-        if ((SUPPORTED_EXTENSIONS as readonly string[]).includes(ext)) {
-          files.push(fullPath);
-        }
+        subdirs.push(walk(fullPath));
+      } else if (SUPPORTED_EXTENSION_SET.has(extname(entry.name).toLowerCase())) {
+        files.push(fullPath);
       }
     }
+    await Promise.all(subdirs);
   }
 
   await walk(inputFolder);
   return files.sort();
 }
 
+/**
+ * Start loading the backend's model while the first file is still being
+ * converted. Failures are ignored here; the first transcription reports them.
+ */
+function startWarmup(backend: TranscriptionBackend, config: Config): Promise<void> {
+  return backend.prepare?.(config.whisperModel, config.device).catch(() => {}) ?? Promise.resolve();
+}
+
+/**
+ * Whether a file can go to the backend without audio extraction: it fits the
+ * backend's upload limit, and it is a plain audio file or the backend decodes
+ * any container and the file is short enough that it will not be split.
+ * Oversized audio (e.g. WAV for an API backend) is converted to MP3 instead,
+ * so it is not split into many stream-copied parts.
+ */
+export async function canReadInputDirectly(
+  filePath: string,
+  caps: BackendCapabilities,
+  maxDurationSeconds: number,
+): Promise<boolean> {
+  if (caps.maxInputBytes && statSync(filePath).size > caps.maxInputBytes) {
+    return false;
+  }
+  if (DIRECT_AUDIO_EXTENSIONS.includes(extname(filePath).toLowerCase())) {
+    return true;
+  }
+  if (!caps.decodesAnyInput) {
+    return false;
+  }
+  const duration = await getAudioDuration(filePath).catch(() => Infinity);
+  return duration <= maxDurationSeconds;
+}
+
+/**
+ * Move a finished transcript into the output folder. The temp folder usually
+ * sits on the same volume, so this is a rename; across volumes it falls back
+ * to copy and delete.
+ */
+async function moveFile(from: string, to: string): Promise<void> {
+  try {
+    await rename(from, to);
+  } catch (err) {
+    if ((err as NodeJS.ErrnoException).code !== "EXDEV") throw err;
+    await copyFile(from, to);
+    await rm(from, { force: true });
+  }
+}
+
+/**
+ * Transcribe every part of one file, in one batched call when the backend
+ * supports it and the file was split, otherwise part by part. Each result is
+ * numbered from 1 and carries its part's start offset for the merge.
+ */
+export async function transcribeParts(
+  backend: TranscriptionBackend,
+  partOptions: TranscribeOptions[],
+  partOffsets: number[],
+  filePath: string,
+  onProgress: ProgressCallback,
+): Promise<TranscriptSegment[]> {
+  let segments: TranscriptSegment[];
+
+  if (backend.transcribeBatch && partOptions.length > 1) {
+    // One call for all parts keeps the backend's model state warm
+    segments = await backend.transcribeBatch(partOptions);
+  } else {
+    segments = [];
+    for (let i = 0; i < partOptions.length; i++) {
+      onProgress({
+        event: "step_progress",
+        file: filePath,
+        step: "transcribe",
+        current: i + 1,
+        total: partOptions.length,
+        message: basename(partOptions[i]!.inputFile),
+      });
+
+      segments.push(await backend.transcribe(partOptions[i]!));
+    }
+  }
+
+  return segments.map((segment, i) => ({
+    ...segment,
+    partNumber: i + 1,
+    offsetMs: Math.round(partOffsets[i]! * 1000),
+  }));
+}
+
 /**
  * Process a single file through the transcription pipeline.
+ * Transcription runs through `transcribeLimit` so concurrent files share the
+ * backend (and its GPU) one at a time while ffmpeg steps overlap.
  */
 async function processFile(
   filePath: string,
@@ -82,34 +182,54 @@ async function processFile(
   fileNum: number,
   totalFiles: number,
   onProgress: ProgressCallback,
+  transcribeLimit: Limiter,
 ): Promise<FileResult> {
   const baseName = basename(filePath, extname(filePath));
-  const tempFolder = config.tempFolder;
+  // Per-file temp folder: files with the same name in different subfolders
+  // may be processed at the same time.
+  const tempFolder = join(config.tempFolder, `${String(fileNum).padStart(3, "0")}_${baseName}`);
   const outputFolder = config.outputFolder;
+  // Split cores by the files that actually run at once, not the --parallel cap
+  const ffmpegThreads = ffmpegThreadsFor(Math.min(config.parallelFiles, totalFiles));
 
   onProgress({ event: "file_start", file: filePath, fileNumber: fileNum, totalFiles });
 
   let durationSeconds = 0;
 
   try {
-    // Step 1: Convert to MP3 if needed
-    let mp3File: string;
-    const convertedTarget = join(tempFolder, `${baseName}.mp3`);
-    if (extname(filePath).toLowerCase() === ".mp3") {
-      mp3File = filePath;
+    // Step 1: Extract (and optionally enhance) audio. Plain audio files, and
+    // inputs the backend decodes itself, are used as they are.
+    const caps = backend.capabilities();
+    let sourceAudio: string;
+    if (config.enableAudioEnhancement) {
+      onProgress({
+        event: "step_start",
+        file: filePath,
+        step: "enhance",
+        message: `${filePath} -> ${tempFolder}`,
+      });
+      sourceAudio = await convertAndEnhance(filePath, tempFolder, 2, ffmpegThreads);
+      onProgress({
+        event: "step_complete",
+        file: filePath,
+        step: "enhance",
+        message: `Created ${sourceAudio}`,
+      });
+    } else if (await canReadInputDirectly(filePath, caps, config.maxDurationSeconds)) {
+      sourceAudio = filePath;
     } else {
       onProgress({
         event: "step_start",
         file: filePath,
         step: "convert",
-        message: `${filePath} -> ${convertedTarget}`,
+        message: `${filePath} -> ${tempFolder}`,
       });
-      mp3File = await convertToMp3(filePath, tempFolder);
+      sourceAudio = await extractAudio(filePath, tempFolder, 2);
       onProgress({
         event: "step_complete",
         file: filePath,
         step: "convert",
-        message: `Created ${mp3File}`,
+        message: `Created ${sourceAudio}`,
       });
     }
 
@@ -118,9 +238,9 @@ async function processFile(
       event: "step_start",
       file: filePath,
       step: "check_duration",
-      message: `Reading duration from ${mp3File}`,
+      message: `Reading duration from ${sourceAudio}`,
     });
-    durationSeconds = await getAudioDuration(mp3File);
+    durationSeconds = await getAudioDuration(sourceAudio);
     onProgress({
       event: "step_complete",
       file: filePath,
@@ -128,24 +248,25 @@ async function processFile(
       message: `Duration ${Math.round(durationSeconds)}s (split threshold ${config.maxDurationSeconds}s)`,
     });
 
-    const mp3SizeBytes = statSync(mp3File).size;
-    const maxInputBytes = backend.capabilities().maxInputBytes;
+    const audioSizeBytes = statSync(sourceAudio).size;
+    const maxInputBytes = caps.maxInputBytes;
     const numParts = calculateSplitPartsForConstraints(
       durationSeconds,
       config.maxDurationSeconds,
-      mp3SizeBytes,
+      audioSizeBytes,
       maxInputBytes,
     );
     const needsSplit = numParts > 1;
     let audioFiles: string[];
+    let partOffsets: number[];
 
     if (needsSplit) {
       const reasons = [
         durationSeconds > config.maxDurationSeconds
           ? `${Math.round(durationSeconds)}s duration`
           : null,
-        maxInputBytes && mp3SizeBytes > maxInputBytes
-          ? `${Math.round(mp3SizeBytes / 1024 / 1024)}MB backend limit`
+        maxInputBytes && audioSizeBytes > maxInputBytes
+          ? `${Math.round(audioSizeBytes / 1024 / 1024)}MB backend limit`
           : null,
       ].filter(Boolean).join(", ");
       onProgress({
@@ -154,7 +275,9 @@ async function processFile(
         step: "split",
         message: `${reasons} -> ${numParts} parts`,
       });
-      audioFiles = await splitAudio(mp3File, numParts, tempFolder, baseName);
+      const splitParts = await splitAudio(sourceAudio, numParts, tempFolder, baseName);
+      audioFiles = splitParts.map((part) => part.file);
+      partOffsets = splitParts.map((part) => part.startSeconds);
       onProgress({
         event: "step_complete",
         file: filePath,
@@ -162,64 +285,34 @@ async function processFile(
         message: `Created ${audioFiles.length} part(s)`,
       });
     } else {
-      audioFiles = [mp3File];
-    }
-
-    // Step 3: Enhance audio if requested
-    if (config.enableAudioEnhancement) {
-      onProgress({
-        event: "step_start",
-        file: filePath,
-        step: "enhance",
-        message: `Enhancing ${audioFiles.length} file(s)`,
-      });
-      const enhanced: string[] = [];
-      for (const audioFile of audioFiles) {
-        const result = await enhanceAudio(audioFile, tempFolder);
-        enhanced.push(result);
-      }
-      audioFiles = enhanced;
-      onProgress({
-        event: "step_complete",
-        file: filePath,
-        step: "enhance",
-        message: `Enhanced ${audioFiles.length} file(s)`,
-      });
+      audioFiles = [sourceAudio];
+      partOffsets = [0];
     }
 
-    // Step 4: Transcribe
+    // Step 3: Transcribe
     onProgress({
       event: "step_start",
       file: filePath,
       step: "transcribe",
       message: `${audioFiles.length} part(s), model=${config.whisperModel}, backend=${backend.name}`,
     });
-    const transcriptParts = [];
-
-    for (let i = 0; i < audioFiles.length; i++) {
-      const audioFile = audioFiles[i]!;
-      const partNum = i + 1;
-      const partDir = join(tempFolder, `${baseName}_part${String(partNum).padStart(2, "0")}`);
-
-      onProgress({
-        event: "step_progress",
-        file: filePath,
-        step: "transcribe",
-        current: partNum,
-        total: audioFiles.length,
-        message: basename(audioFile),
-      });
-
-      const segment = await backend.transcribe({
-        inputFile: audioFile,
-        model: config.whisperModel,
-        device: config.device,
-        outputDir: partDir,
-        outputFormats: config.outputFormats,
-      });
-
-      transcriptParts.push({ ...segment, partNumber: partNum });
-    }
+    // Transcripts are written to temp folders and only reach the output
+    // folder once the file succeeds. A single part is already named after
+    // the source file, so it is moved into place instead of merged.
+    const singlePart = audioFiles.length === 1;
+    const partOptions = audioFiles.map((audioFile, i) => ({
+      inputFile: audioFile,
+      model: config.whisperModel,
+      device: config.device,
+      outputDir: singlePart
+        ? join(tempFolder, `${baseName}_transcript`)
+        : join(tempFolder, `${baseName}_part${String(i + 1).padStart(2, "0")}`),
+      outputFormats: config.outputFormats,
+      outputName: singlePart ? baseName : undefined,
+    }));
+    const transcriptParts = await transcribeLimit(() =>
+      transcribeParts(backend, partOptions, partOffsets, filePath, onProgress),
+    );
     onProgress({
       event: "step_complete",
       file: filePath,
@@ -227,12 +320,10 @@ async function processFile(
       message: `Completed ${transcriptParts.length} part(s)`,
     });
 
-    // Step 5: Merge or copy output
+    // Step 4: Merge split outputs, or move a single transcript into place
     let outputTxt: string | null = null;
     let outputSrt: string | null = null;
 
-    await mkdir(outputFolder, { recursive: true });
-
     const wantTxt = config.outputFormats.includes("txt");
     const wantSrt = config.outputFormats.includes("srt");
 
@@ -254,28 +345,16 @@ async function processFile(
         message: `Merged outputs written`,
       });
     } else {
-      onProgress({
-        event: "step_start",
-        file: filePath,
-        step: "copy_output",
-        message: `Copying transcript files to ${outputFolder}`,
-      });
       const part = transcriptParts[0]!;
+      await mkdir(outputFolder, { recursive: true });
       if (wantTxt && part.txtFile && existsSync(part.txtFile)) {
         outputTxt = join(outputFolder, `${baseName}.txt`);
-        await cp(part.txtFile, outputTxt);
+        await moveFile(part.txtFile, outputTxt);
       }
       if (wantSrt && part.srtFile && existsSync(part.srtFile)) {
         outputSrt = join(outputFolder, `${baseName}.srt`);
-        await cp(part.srtFile, outputSrt);
+        await moveFile(part.srtFile, outputSrt);
       }
-      const produced = [outputTxt && "txt", outputSrt && "srt"].filter(Boolean).join(", ");
-      onProgress({
-        event: "step_complete",
-        file: filePath,
-        step: "copy_output",
-        message: `Copied outputs (${produced})`,
-      });
     }
 
     onProgress({ event: "file_complete", file: filePath, success: true });
@@ -319,19 +398,27 @@ export async function runPipeline(
 
   onProgress({ event: "batch_start", totalFiles: inputFiles.length });
 
-  // Process each file
-  const results: FileResult[] = [];
-  for (let i = 0; i < inputFiles.length; i++) {
-    const result = await processFile(
-      inputFiles[i]!,
-      config,
-      backend,
-      i + 1,
-      inputFiles.length,
-      onProgress,
-    );
-    results.push(result);
-  }
+  const warmup = inputFiles.length > 0 ? startWarmup(backend, config) : Promise.resolve();
+
+  // Process files concurrently; transcription itself stays serialized
+  const transcribeLimit = createLimiter(1);
+  const results = await mapWithConcurrency(
+    inputFiles,
+    config.parallelFiles,
+    (filePath, i) =>
+      processFile(
+        filePath,
+        config,
+        backend,
+        i + 1,
+        inputFiles.length,
+        onProgress,
+        transcribeLimit,
+      ),
+  );
+
+  await warmup;
+  await backend.dispose?.();
 
   // Cleanup temp files
   if (!config.keepIntermediateFiles && existsSync(config.tempFolder)) {
@@ -363,7 +450,19 @@ export async function runSingleFile(
   backend: TranscriptionBackend,
   onProgress: ProgressCallback = () => {},
 ): Promise<FileResult> {
-  const result = await processFile(filePath, config, backend, 1, 1, onProgress);
+  const warmup = startWarmup(backend, config);
+  const result = await processFile(
+    filePath,
+    config,
+    backend,
+    1,
+    1,
+    onProgress,
+    createLimiter(1),
+  );
+
+  await warmup;
+  await backend.dispose?.();
 
   // Cleanup temp files
   if (!config.keepIntermediateFiles && existsSync(config.tempFolder)) {
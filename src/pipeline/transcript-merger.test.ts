@@ -1,8 +1,12 @@
 import { describe, it, expect } from "vitest";
+import { mkdtemp, readFile, rm, writeFile } from "node:fs/promises";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
 import {
   parseSrtTimestamp,
   formatSrtTimestamp,
   parseSrt,
+  mergeTranscripts,
 } from "./transcript-merger.js";
 
 describe("parseSrtTimestamp", () => {
@@ -39,6 +43,14 @@ describe("formatSrtTimestamp", () => {
     expect(formatSrtTimestamp(ms)).toBe("02:30:45,123");
   });
 
+  it("rounds fractional milliseconds", () => {
+    expect(formatSrtTimestamp(1500.6)).toBe("00:00:01,501");
+  });
+
+  it("clamps negative values to zero", () => {
+    expect(formatSrtTimestamp(-20)).toBe("00:00:00,000");
+  });
+
   it("roundtrips correctly", () => {
     const timestamp = "01:15:30,789";
     const ms = parseSrtTimestamp(timestamp);
@@ -99,3 +111,89 @@ describe("parseSrt", () => {
     expect(entries[0]!.text).toBe("Test");
   });
 });
+
+describe("mergeTranscripts", () => {
+  it("renumbers and offsets SRT entries across parts", async () => {
+    const dir = await mkdtemp(join(tmpdir(), "merge-"));
+    try {
+      const part1 = join(dir, "part1.srt");
+      const part2 = join(dir, "part2.srt");
+      await writeFile(
+        part1,
+        "1\r\n00:00:01,000 --> 00:00:02,000\r\nFirst\r\n\r\n2\r\n00:00:03,000 --> 00:00:04,500\r\nSecond\r\nline\r\n",
+      );
+      await writeFile(part2, "1\n00:00:00,500 --> 00:00:01,000\nThird\n\n");
+
+      const output = join(dir, "merged.srt");
+      await mergeTranscripts(
+        [
+          { txtFile: null, srtFile: part2, partNumber: 2 },
+          { txtFile: null, srtFile: part1, partNumber: 1 },
+        ],
+        null,
+        output,
+      );
+
+      expect(await readFile(output, "utf-8")).toBe(
+        [
+          "1",
+          "00:00:01,000 --> 00:00:02,000",
+          "First",
+          "",
+          "2",
+          "00:00:03,000 --> 00:00:04,500",
+          "Second",
+          "line",
+          "",
+          "3",
+          "00:00:05,000 --> 00:00:05,500",
+          "Third",
+          "",
+        ].join("\n"),
+      );
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+
+  it("uses known part offsets instead of the previous end time", async () => {
+    const dir = await mkdtemp(join(tmpdir(), "merge-"));
+    try {
+      const part1 = join(dir, "part1.srt");
+      const part2 = join(dir, "part2.srt");
+      await writeFile(part1, "1\n00:00:01,000 --> 00:00:02,000\nFirst\n\n");
+      await writeFile(part2, "1\n00:00:00,500 --> 00:00:01,000\nSecond\n\n");
+
+      const output = join(dir, "merged.srt");
+      await mergeTranscripts(
+        [
+          { txtFile: null, srtFile: part1, partNumber: 1, offsetMs: 0 },
+          { txtFile: null, srtFile: part2, partNumber: 2, offsetMs: 600000 },
+        ],
+        null,
+        output,
+      );
+
+      const entries = parseSrt(await readFile(output, "utf-8"));
+      expect(entries[1]!.startTime).toBe(600500);
+      expect(entries[1]!.endTime).toBe(601000);
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+
+  it("rejects when the SRT output cannot be written", async () => {
+    const dir = await mkdtemp(join(tmpdir(), "merge-"));
+    try {
+      const part = join(dir, "part1.srt");
+      await writeFile(part, "1\n00:00:01,000 --> 00:00:02,000\nFirst\n\n");
+
+      // The output path is a directory, so opening it for writing fails
+      await expect(
+        mergeTranscripts([{ txtFile: null, srtFile: part, partNumber: 1 }], null, dir),
+      ).rejects.toThrow("EISDIR");
+    } finally {
+      await rm(dir, { recursive: true, force: true });
+    }
+  });
+});
@@ -1,41 +1,55 @@
-import { readFile, writeFile, mkdir } from "node:fs/promises";
-import { existsSync } from "node:fs";
+import { readFile, writeFile, mkdir, open } from "node:fs/promises";
+import { createReadStream, existsSync } from "node:fs";
 import { dirname } from "node:path";
+import { createInterface } from "node:readline";
 import type { TranscriptSegment, SrtEntry } from "../types/index.js";
 
+/** Characters of merged SRT output buffered between writes */
+const WRITE_BUFFER_CHARS = 1 << 20;
+
+const TIMESTAMP_RE = /(\d{2}):(\d{2}):(\d{2}),(\d{3})/;
+const TIMESTAMP_LINE_RE = /(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})/;
+const INDEX_LINE_RE = /^\d+$/;
+const LINE_BREAK_RE = /\r?\n/;
+
+/** Whether a trimmed line is a subtitle index; long lines are rejected before the regex runs */
+function isIndexLine(line: string): boolean {
+  return line.length > 0 && line.length < 10 && INDEX_LINE_RE.test(line);
+}
+
 /**
  * Parse SRT timestamp string "HH:MM:SS,mmm" to milliseconds.
  */
 export function parseSrtTimestamp(timestamp: string): number {
-  const match = timestamp.match(/(\d{2}):(\d{2}):(\d{2}),(\d{3})/);
+  const match = TIMESTAMP_RE.exec(timestamp);
   if (!match) return 0;
 
-  const [, hours, minutes, seconds, ms] = match;
   return (
-    Number.parseInt(hours!, 10) * 3600000 +
-    Number.parseInt(minutes!, 10) * 60000 +
-    Number.parseInt(seconds!, 10) * 1000 +
-    Number.parseInt(ms!, 10)
+    +match[1]! * 3600000 +
+    +match[2]! * 60000 +
+    +match[3]! * 1000 +
+    +match[4]!
   );
 }
 
 /**
  * Format milliseconds to SRT timestamp "HH:MM:SS,mmm".
+ * Fractional and negative inputs are rounded and clamped to whole milliseconds.
  */
 export function formatSrtTimestamp(ms: number): string {
-  const hours = Math.floor(ms / 3600000);
-  const minutes = Math.floor((ms % 3600000) / 60000);
-  const seconds = Math.floor((ms % 60000) / 1000);
-  const milliseconds = ms % 1000;
+  let rest = Math.max(0, Math.round(ms));
+  const hours = Math.floor(rest / 3600000);
+  rest -= hours * 3600000;
+  const minutes = Math.floor(rest / 60000);
+  rest -= minutes * 60000;
+  const seconds = Math.floor(rest / 1000);
+  const milliseconds = rest - seconds * 1000;
 
   return (
-    String(hours).padStart(2, "0") +
-    ":" +
-    String(minutes).padStart(2, "0") +
-    ":" +
-    String(seconds).padStart(2, "0") +
-    "," +
-    String(milliseconds).padStart(3, "0")
+    (hours < 10 ? "0" : "") + hours +
+    (minutes < 10 ? ":0" : ":") + minutes +
+    (seconds < 10 ? ":0" : ":") + seconds +
+    "," + String(milliseconds).padStart(3, "0")
   );
 }
 
@@ -44,23 +58,21 @@ export function formatSrtTimestamp(ms: number): string {
  */
 export function parseSrt(content: string): SrtEntry[] {
   const entries: SrtEntry[] = [];
-  const lines = content.split(/\r?\n/);
+  const lines = content.split(LINE_BREAK_RE);
   let i = 0;
 
   while (i < lines.length) {
     const line = lines[i]!.trim();
 
     // Look for subtitle index (a number on its own line)
-    if (/^\d+$/.test(line)) {
+    if (isIndexLine(line)) {
       const index = Number.parseInt(line, 10);
       i++;
 
       // Next line should be timestamp
       if (i >= lines.length) break;
       const timestampLine = lines[i]!.trim();
-      const tsMatch = timestampLine.match(
-        /(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})/,
-      );
+      const tsMatch = TIMESTAMP_LINE_RE.exec(timestampLine);
 
       if (tsMatch) {
         const startTime = parseSrtTimestamp(tsMatch[1]!);
@@ -93,7 +105,9 @@ export function parseSrt(content: string): SrtEntry[] {
 
 /**
  * Merge multiple transcript parts into single txt and srt files.
- * Re-numbers subtitles sequentially and adjusts timestamps with cumulative offset.
+ * Re-numbers subtitles sequentially and shifts timestamps by each part's
+ * offsetMs, or by the previous part's last end time when no offset is known.
+ * SRT parts are streamed line by line into a buffered output file.
  * Port of lib/transcript_merger.py merge_transcripts()
  */
 export async function mergeTranscripts(
@@ -118,44 +132,97 @@ export async function mergeTranscripts(
   }
 
   // Merge SRT files with timestamp adjustment
-  const allEntries: SrtEntry[] = [];
-  let cumulativeOffset = 0;
-
-  for (const part of sorted) {
-    if (!part.srtFile || !existsSync(part.srtFile)) continue;
-
-    const content = await readFile(part.srtFile, "utf-8");
-    const entries = parseSrt(content);
-
-    let lastEndTime = 0;
-    for (const entry of entries) {
-      allEntries.push({
-        index: allEntries.length + 1,
-        startTime: entry.startTime + cumulativeOffset,
-        endTime: entry.endTime + cumulativeOffset,
-        text: entry.text,
-      });
-      lastEndTime = entry.endTime + cumulativeOffset;
-    }
+  if (outputSrt) {
+    await mkdir(dirname(outputSrt), { recursive: true });
+    // Writes go through a FileHandle so open and write failures reject the
+    // merge instead of surfacing as stream 'error' events.
+    const out = await open(outputSrt, "w");
+    let buffered = "";
+    const write = async (chunk: string) => {
+      buffered += chunk;
+      if (buffered.length >= WRITE_BUFFER_CHARS) {
+        await out.writeFile(buffered, "utf-8");
+        buffered = "";
+      }
+    };
+
+    try {
+      let written = 0;
+      let cumulativeOffset = 0;
 
-    if (lastEndTime > 0) {
-      cumulativeOffset = lastEndTime;
+      for (const part of sorted) {
+        if (!part.srtFile || !existsSync(part.srtFile)) continue;
+
+        const offset = part.offsetMs ?? cumulativeOffset;
+        const result = await appendSrtPart(write, part.srtFile, offset, written);
+        written = result.lastIndex;
+        if (result.lastEndTime > 0) {
+          cumulativeOffset = result.lastEndTime;
+        }
+      }
+
+      if (buffered) {
+        await out.writeFile(buffered, "utf-8");
+      }
+    } finally {
+      await out.close();
     }
   }
+}
 
-  // Write merged SRT
-  if (outputSrt) {
-    const srtLines: string[] = [];
-    for (const entry of allEntries) {
-      srtLines.push(String(entry.index));
-      srtLines.push(
-        `${formatSrtTimestamp(entry.startTime)} --> ${formatSrtTimestamp(entry.endTime)}`,
+/**
+ * Stream one part's SRT entries through `write`, renumbering from
+ * `lastIndex + 1` and shifting timestamps by `offset`. Lines are written as
+ * they are read, following the same entry rules as parseSrt().
+ */
+async function appendSrtPart(
+  write: (chunk: string) => Promise<void>,
+  srtFile: string,
+  offset: number,
+  lastIndex: number,
+): Promise<{ lastIndex: number; lastEndTime: number }> {
+  const lines = createInterface({
+    input: createReadStream(srtFile, { encoding: "utf-8" }),
+    crlfDelay: Infinity,
+  });
+
+  let state: "index" | "timestamp" | "text" = "index";
+  let textLines = 0;
+  let lastEndTime = 0;
+
+  for await (const rawLine of lines) {
+    const line = rawLine.trim();
+
+    if (state === "index") {
+      if (isIndexLine(line)) state = "timestamp";
+    } else if (state === "timestamp") {
+      const tsMatch = TIMESTAMP_LINE_RE.exec(line);
+      if (!tsMatch) {
+        state = "index";
+        continue;
+      }
+
+      const startTime = parseSrtTimestamp(tsMatch[1]!) + offset;
+      lastEndTime = parseSrtTimestamp(tsMatch[2]!) + offset;
+      lastIndex++;
+      await write(
+        `${lastIndex > 1 ? "\n" : ""}${lastIndex}\n` +
+          `${formatSrtTimestamp(startTime)} --> ${formatSrtTimestamp(lastEndTime)}\n`,
       );
-      srtLines.push(entry.text);
-      srtLines.push("");
+      textLines = 0;
+      state = "text";
+    } else if (line !== "") {
+      await write(`${line}\n`);
+      textLines++;
+    } else {
+      if (textLines === 0) await write("\n");
+      state = "index";
     }
+  }
 
-    await mkdir(dirname(outputSrt), { recursive: true });
-    await writeFile(outputSrt, srtLines.join("\n"), "utf-8");
+  if (state === "text" && textLines === 0) {
+    await write("\n");
   }
+
+  return { lastIndex, lastEndTime };
 }
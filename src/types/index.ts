@@ -35,6 +35,8 @@ export interface TranscriptSegment {
   txtFile: string | null;
   srtFile: string | null;
   partNumber: number;
+  /** Start of this part within the source audio (ms), when known */
+  offsetMs?: number;
 }
 
 /** Result from processing a single input file */
@@ -96,8 +98,7 @@ export type PipelineStep =
   | "split"
   | "enhance"
   | "transcribe"
-  | "merge"
-  | "copy_output";
+  | "merge";
 
 /** Exit codes */
 export const ExitCode = {